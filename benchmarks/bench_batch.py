@@ -0,0 +1,71 @@
+"""
+encode_batch/decode_batch öndürijiligini dürli işçi sanlary bilen ölçeýär (setir/s).
+
+Ulanyş:
+    python benchmarks/bench_batch.py --model turkmen_tokenizer.json --workers 1 2 4
+Model berilmese, korpusda kiçi tokenizer öwredilýär.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--vocab-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk-size", type=int, default=512)
+    args = parser.parse_args()
+
+    tokenizer = TurkmenBPETokenizer(vocab_size=args.vocab_size)
+    if args.model:
+        tokenizer.load(args.model)
+    else:
+        tokenizer.train(args.corpus, verbose=False)
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    print(f"{len(lines)} setir, CPU: {os.cpu_count()}")
+
+    expected = None
+    for workers in args.workers:
+        # Her ölçeg arassa keş bilen başlaýar
+        tokenizer.clear_cache()
+        tokenizer.close_pool()
+        if workers > 1:
+            # Pool döretmek wagtyny ölçege goşmaýarys
+            tokenizer._get_pool(workers)
+
+        start = time.perf_counter()
+        encoded = tokenizer.encode_batch(lines, num_workers=workers, chunk_size=args.chunk_size)
+        encode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = tokenizer.decode_batch(encoded, num_workers=workers, chunk_size=args.chunk_size)
+        decode_time = time.perf_counter() - start
+
+        if expected is None:
+            expected = (encoded, decoded)
+        elif (encoded, decoded) != expected:
+            print(f"❌ {workers} işçi bilen netije tapawutly!")
+            sys.exit(1)
+
+        print(f"  işçi={workers:2d}  encode: {len(lines) / encode_time:10.0f} setir/s"
+              f"  decode: {len(lines) / decode_time:10.0f} setir/s")
+
+    tokenizer.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+DocumentSession.apply_edit bilen doly encode-y deňeşdirýär: korpusyň başyndan
+dürli ululykdaky resminamalar alynýar we ortasynda "ýazmak" (harp goşmak we
+pozmak) simulirlenýär. Soňky netije encode(text) bilen gabat gelmese 1 kody bilen çykýar.
+
+Ulanyş:
+    python benchmarks/bench_edit.py --sizes 10000 100000 1000000 --edits 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def simulate_typing(session, edits, seed):
+    """
+    Resminamanyň ortasynda harp goşmak (80%) we pozmak (20%)
+    """
+    rng = random.Random(seed)
+    cursor = len(session.text) // 2
+    for _ in range(edits):
+        if rng.random() < 0.8 or cursor == 0:
+            session.apply_edit(cursor, cursor, rng.choice("abdegilmnrsşýä ,"))
+            cursor += 1
+        else:
+            session.apply_edit(cursor - 1, cursor, "")
+            cursor -= 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--vocab-size", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--edits", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tokenizer = TurkmenBPETokenizer(vocab_size=args.vocab_size)
+    tokenizer.train(args.corpus, verbose=False)
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = f.read()
+
+    print(f"{'simwol':>10} {'doly encode, ms':>16} {'apply_edit, µs':>15} {'tizlenme':>9}")
+    for size in args.sizes:
+        text = corpus[:size]
+        start = time.perf_counter()
+        tokenizer.encode(text)
+        full = time.perf_counter() - start
+
+        session = tokenizer.document_session(text)
+        start = time.perf_counter()
+        simulate_typing(session, args.edits, args.seed)
+        per_edit = (time.perf_counter() - start) / args.edits
+
+        if session.ids != tokenizer.encode(session.text):
+            print(f"❌ {size} simwol: netije encode bilen gabat gelmeýär")
+            sys.exit(1)
+        print(f"{len(text):>10} {full * 1000:>16.2f} {per_edit * 1e6:>15.1f} {full / per_edit:>8.0f}x")
+    print("✓ Ähli netijeler encode bilen gabat gelýär")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Köp sözli atlaryň (trie) pre_tokenize tizligine täsirini ölçeýär.
+
+Korpusdaky yzygider söz jübütlerinden we üçlüklerinden sintetik gazetteer
+(--entities sany) döredilýär we add_cities bilen goşulýar. Soňra pre_tokenize
+tizligi (MB/s) adaty tokenizer, trie bilen we her orunda n-gram gözleýän sada
+usul bilen deňeşdirilýär, trie-niň adatydan haýallamasy göterimde görkezilýär. Trie netijesi sada usul bilen ýa-da encode_with_offsets
+ID-leri encode bilen (atlar söz kitabynda bar we ýok) gabat gelmese 1 kody bilen çykýar.
+
+Ulanyş:
+    python benchmarks/bench_entities.py --entities 300000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TOKEN_RE, TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def synthetic_entities(lines, count, seed):
+    """
+    Korpusdaky yzygider 2-3 sözden köp sözli atlar
+    """
+    rng = random.Random(seed)
+    candidates = set()
+    for line in lines:
+        words = [word for word in TOKEN_RE.findall(line.lower()) if word.isalpha()]
+        for size in (2, 3):
+            for i in range(len(words) - size + 1):
+                candidates.add(" ".join(words[i:i + size]))
+    candidates = sorted(candidates)
+    rng.shuffle(candidates)
+    return candidates[:count]
+
+
+def naive_pre_tokenize(tokenizer, entities, max_size, text):
+    """
+    Sada usul: her orunda iň uzyn n-gramdan başlap set-de gözlemek
+    """
+    raw_tokens = TOKEN_RE.findall(text.lower())
+    typed_tokens = []
+    index = 0
+    while index < len(raw_tokens):
+        for size in range(min(max_size, len(raw_tokens) - index), 1, -1):
+            candidate = " ".join(raw_tokens[index:index + size])
+            if candidate in entities:
+                typed_tokens.append((candidate, tokenizer._gazetteer[candidate]))
+                index += size
+                break
+        else:
+            typed_tokens.extend(tokenizer._split_token(raw_tokens[index]))
+            index += 1
+    return typed_tokens
+
+
+def throughput(func, lines, total_mb, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [func(line) for line in lines]
+        best = min(best, time.perf_counter() - start)
+    return total_mb / best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--entities", type=int, default=300000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lines = read_lines(args.corpus)
+    total_mb = sum(len(line.encode("utf-8")) for line in lines) / 2 ** 20
+    entities = synthetic_entities(lines, args.entities, args.seed)
+    print(f"Korpus: {args.corpus} ({total_mb:.2f} MB), {len(entities)} köp sözli at")
+
+    plain = TurkmenBPETokenizer()
+    plain_speed, _ = throughput(plain.pre_tokenize, lines, total_mb, args.repeat)
+    print(f"pre_tokenize (adaty):          {plain_speed:7.2f} MB/s")
+
+    tokenizer = TurkmenBPETokenizer()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokenizer.add_cities(entities)
+    print(f"add_cities ({len(entities)} at):      {time.perf_counter() - start:7.2f} s")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokenizer.add_cities(["täze bir şäher"])
+    print(f"add_cities (1 at, artýmly):    {(time.perf_counter() - start) * 1000:7.2f} ms")
+
+    speed, result = throughput(tokenizer.pre_tokenize, lines, total_mb, args.repeat)
+    matched = sum(1 for typed_tokens in result for token, _ in typed_tokens if " " in token)
+    print(f"pre_tokenize (trie):           {speed:7.2f} MB/s, {matched} at tapyldy "
+          f"(adatydan {100.0 * (speed / plain_speed - 1):+.0f}%)")
+
+    entity_set = set(entities) | {"täze bir şäher"}
+    max_size = max(len(entity.split()) for entity in entity_set)
+    naive_speed, naive_result = throughput(
+        lambda line: naive_pre_tokenize(tokenizer, entity_set, max_size, line), lines, total_mb, 1)
+    print(f"pre_tokenize (sada n-gram):    {naive_speed:7.2f} MB/s")
+
+    if naive_result != result:
+        print("❌ Trie netijesi sada usul bilen gabat gelmeýär")
+        sys.exit(1)
+    print("✓ Trie netijesi sada usul bilen gabat gelýär")
+
+    # Söz kitabynda ýok köp sözli atyň sözleri (özleri aýratyn at bolsa-da) BPE bilen
+    # birleşdirilýär - encode we encode_with_offsets şeýle etmeli
+    without_ids = TurkmenBPETokenizer()
+    words = sorted({word for entity in entities for word in entity.split()})
+    with contextlib.redirect_stdout(io.StringIO()):
+        without_ids.add_cities(entities + words)
+    for entity in entities:
+        del without_ids.vocab[entity + "</w>"]
+    without_ids._refresh_tables()
+    sample = [line for line, typed_tokens in zip(lines, result)
+              if any(" " in token for token, _ in typed_tokens)][:2000]
+    for checked in (tokenizer, without_ids):
+        for line in sample:
+            if checked.encode_with_offsets(line)["ids"] != checked.encode(line):
+                print(f"❌ encode_with_offsets encode bilen gabat gelmeýär: {line!r}")
+                sys.exit(1)
+    print(f"✓ encode_with_offsets = encode ({len(sample)} atly setir, söz kitabynda bar/ýok)")
+
+
+if __name__ == "__main__":
+    main()
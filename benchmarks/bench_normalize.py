@@ -0,0 +1,74 @@
+"""
+normalize_text we pre_tokenize öndürijiligi (MB/s): köne yzygiderli str.replace usuly
+we täze str.translate + öňünden düzülen regex.
+
+Ulanyş:
+    python benchmarks/bench_normalize.py
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import unicodedata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def legacy_normalize_text(text):
+    text = unicodedata.normalize("NFKC", text)
+    replacements = {
+        "ÿ": "ý", "¥": "ý", "ə": "ä", "ş": "ş", "s": "ş",
+        "“": '"', "”": '"', "’": "'", "‘": "'", "\u00ad": "", "&nbsp;": " ",
+    }
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip().lower()
+
+
+def measure(func, lines, total_mb, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [func(line) for line in lines]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return total_mb / best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    total_mb = sum(len(line.encode("utf-8")) for line in lines) / 1e6
+    print(f"{len(lines)} setir, {total_mb:.2f} MB")
+
+    plain = TurkmenBPETokenizer()
+    normalizing = TurkmenBPETokenizer(normalize=True)
+
+    legacy_speed, expected = measure(legacy_normalize_text, lines, total_mb)
+    speed, actual = measure(plain.normalize_text, lines, total_mb)
+    print(f"normalize_text (köne):          {legacy_speed:7.2f} MB/s")
+    print(f"normalize_text (täze):          {speed:7.2f} MB/s")
+    if actual != expected:
+        print("❌ normalize_text netijeleri gabat gelmeýär!")
+        sys.exit(1)
+
+    speed, _ = measure(plain.pre_tokenize, lines, total_mb)
+    print(f"pre_tokenize:                   {speed:7.2f} MB/s")
+    speed, _ = measure(normalizing.pre_tokenize, lines, total_mb)
+    print(f"normalize + pre_tokenize:       {speed:7.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+train() öwreniş býujetini (min_frequency, max_unique_words, min_pair_frequency)
+doly öwreniş bilen deňeşdirýär: wagt, iň ýokary RSS, birleşdirmeleriň gabat gelşi
+we korpusdaky token sany (gysyş).
+
+Her sazlama aýratyn prosesde öwredilýär - peak RSS garyşmaz ýaly.
+
+Ulanyş:
+    python benchmarks/bench_prune.py --vocab-size 5000 --min-frequency 2
+    python benchmarks/bench_prune.py --max-unique-words 20000 --min-pair-frequency 3
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux-da KB, macOS-da baýt
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def train_once(task):
+    corpus_path, vocab_size, options = task
+    tokenizer = TurkmenBPETokenizer(vocab_size=vocab_size)
+    profiler = tokenizer.enable_profiling()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokenizer.train(corpus_path, **options)
+    elapsed = time.perf_counter() - start
+    tokenizer.disable_profiling()
+
+    counters = profiler.counters
+    with open(corpus_path, "r", encoding="utf-8") as f:
+        num_tokens = sum(len(tokenizer.encode(line)) for line in f)
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+        "words": counters.get("train.kept_words", counters["train.unique_words"]),
+        "coverage": (counters["train.kept_mass"] / counters["train.total_mass"]
+                     if "train.total_mass" in counters else 1.0),
+        "merges": tokenizer.merges,
+        "tokens": num_tokens,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--vocab-size", type=int, default=5000)
+    parser.add_argument("--min-frequency", type=int, default=2)
+    parser.add_argument("--max-unique-words", type=int, default=None)
+    parser.add_argument("--min-pair-frequency", type=int, default=1)
+    args = parser.parse_args()
+
+    options = {
+        "min_frequency": args.min_frequency,
+        "max_unique_words": args.max_unique_words,
+        "min_pair_frequency": args.min_pair_frequency,
+    }
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name, task_options in (("doly", {}), ("býujet", options)):
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(train_once, ((args.corpus, args.vocab_size, task_options),))
+
+    full, pruned = results["doly"], results["býujet"]
+    print(f"Korpus: {args.corpus}, vocab_size={args.vocab_size}, býujet: {options}")
+    print(f"{'':<10} {'söz':>9} {'örtüş':>8} {'wagt, s':>9} {'RSS, MB':>9} {'birleşdirme':>12} {'token':>10}")
+    for name, result in results.items():
+        print(f"{name:<10} {result['words']:>9} {result['coverage'] * 100:>7.2f}% {result['seconds']:>9.2f} "
+              f"{result['peak_rss_mb']:>9.1f} {len(result['merges']):>12} {result['tokens']:>10}")
+
+    common = len(set(full["merges"]) & set(pruned["merges"]))
+    print(f"\nTizlenme: {full['seconds'] / pruned['seconds']:.2f}x, "
+          f"RSS: {pruned['peak_rss_mb'] - full['peak_rss_mb']:+.1f} MB")
+    print(f"Birleşdirmeleriň {common}/{len(full['merges'])} ({100.0 * common / max(len(full['merges']), 1):.1f}%) "
+          f"doly öwreniş bilen umumy")
+    print(f"Korpusdaky token sany: {100.0 * (pruned['tokens'] / full['tokens'] - 1):+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
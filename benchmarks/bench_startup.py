@@ -0,0 +1,83 @@
+"""
+Tokenizeriň başlangyç çykdajysyny ölçeýär: modul importy, täze nusga döretmek,
+bir nusganyň ýaty (tracemalloc) we saklanan modeli ýüklemek
+(TurkmenBPETokenizer().load we TurkmenBPETokenizer.from_file).
+
+Ulanyş:
+    python benchmarks/bench_startup.py --instances 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def import_time_ms(repeat):
+    """
+    Täze Python prosesinde `import bpetokenizer` wagty (iň gowusy)
+    """
+    code = ("import time; start = time.perf_counter(); import bpetokenizer; "
+            "print((time.perf_counter() - start) * 1000)")
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+        times.append(float(output))
+    return min(times)
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--vocab-size", type=int, default=2000)
+    parser.add_argument("--instances", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Import:               {import_time_ms(args.repeat):8.2f} ms")
+
+    construct = best_of(lambda: [TurkmenBPETokenizer() for _ in range(args.instances)], args.repeat)
+    print(f"TurkmenBPETokenizer(): {construct / args.instances * 1e6:7.1f} µs/nusga")
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [TurkmenBPETokenizer() for _ in range(args.instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Ýat:                  {(after - before) / len(instances) / 1024:8.1f} KB/nusga")
+    del instances
+
+    tokenizer = TurkmenBPETokenizer(vocab_size=args.vocab_size)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        tokenizer.train(args.corpus, verbose=False)
+        path = os.path.join(tmp, "model.json")
+        tokenizer.save(path)
+        load = best_of(lambda: TurkmenBPETokenizer().load(path), args.repeat)
+        from_file = best_of(lambda: TurkmenBPETokenizer.from_file(path), args.repeat)
+        sys.__stdout__.write(f"Ýüklemek:             load {load * 1000:7.2f} ms, "
+                             f"from_file {from_file * 1000:7.2f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
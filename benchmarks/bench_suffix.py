@@ -0,0 +1,63 @@
+"""
+aggressive_suffix_split üçin mikro-benchmark: köne usul (her çagyryşda tertiplemek we
+ähli goşulmalary endswith bilen barlamak) we uzynlyk boýunça toparlanan set.
+
+Ulanyş:
+    python benchmarks/bench_suffix.py
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def legacy_suffix_split(suffixes, word):
+    if len(word) < 4:
+        return word
+    sorted_suffixes = sorted(suffixes, key=len, reverse=True)
+    for suffix in sorted_suffixes:
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            if len(stem) >= 2:
+                return f"{stem} {suffix}"
+    return word
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    tokenizer = TurkmenBPETokenizer()
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        words = re.findall(r"[a-zäňöşüýžа-я]+|[0-9]+|[^\w\s]+", f.read().lower())
+    print(f"{len(words)} söz")
+
+    start = time.perf_counter()
+    expected = [legacy_suffix_split(tokenizer.common_suffixes, word) for word in words]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [tokenizer.aggressive_suffix_split(word) for word in words]
+    fast_time = time.perf_counter() - start
+
+    print(f"Köne usul: {legacy_time:7.3f} s ({len(words) / legacy_time:12.0f} söz/s)")
+    print(f"Täze usul: {fast_time:7.3f} s ({len(words) / fast_time:12.0f} söz/s)")
+    print(f"Tizlenme: {legacy_time / fast_time:.1f}x")
+    if actual != expected:
+        print("❌ Bölünişler gabat gelmeýär!")
+        sys.exit(1)
+    print("✓ Ähli bölünişler gabat gelýär")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+BPE öwrenişiniň tizligini deňeşdirýär: köne doly gaýtadan hasaplaýyş
+(get_pair_frequencies + merge_pair), artýmly _MergeEngine we NumPy
+_NumpyMergeEngine (numpy gurnalan bolsa).
+
+Ulanyş:
+    python benchmarks/bench_train.py --merges 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer, _MergeEngine, _NumpyMergeEngine  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield line.strip()
+
+
+def naive_merges(tokenizer, word_freqs, num_merges):
+    splits = {word: tokenizer.split_word_to_chars(word) for word in word_freqs}
+    merges = []
+    for _ in range(num_merges):
+        pair_freqs = tokenizer.get_pair_frequencies(splits, word_freqs)
+        if not pair_freqs:
+            break
+        best_pair = max(pair_freqs, key=pair_freqs.get)
+        splits = tokenizer.merge_pair(best_pair, splits)
+        merges.append(best_pair)
+    return merges
+
+
+def incremental_merges(tokenizer, word_freqs, num_merges, engine_class=_MergeEngine):
+    splits = {word: tokenizer.split_word_to_chars(word) for word in word_freqs}
+    engine = engine_class(word_freqs, splits)
+    merges = []
+    for _ in range(num_merges):
+        best_pair = engine.best_pair()
+        if best_pair is None:
+            break
+        engine.merge(best_pair)
+        merges.append(best_pair)
+    return merges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--merges", type=int, default=300)
+    args = parser.parse_args()
+
+    tokenizer = TurkmenBPETokenizer()
+    word_freqs = tokenizer.get_word_frequencies(read_lines(args.corpus))
+    print(f"Korpus: {args.corpus} ({len(word_freqs)} üýtgeşik söz)")
+
+    start = time.perf_counter()
+    expected = naive_merges(tokenizer, word_freqs, args.merges)
+    naive_time = time.perf_counter() - start
+    print(f"Köne usul:   {naive_time:8.3f} s ({len(expected) / naive_time:9.1f} birleşdirme/s)")
+
+    start = time.perf_counter()
+    actual = incremental_merges(tokenizer, word_freqs, args.merges)
+    fast_time = time.perf_counter() - start
+    print(f"Artýmly:     {fast_time:8.3f} s ({len(actual) / fast_time:9.1f} birleşdirme/s)")
+
+    print(f"Tizlenme: {naive_time / fast_time:.1f}x")
+    if actual != expected:
+        print("❌ Birleşdirmeler gabat gelmeýär!")
+        sys.exit(1)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy: gurnalmadyk, geçildi")
+    else:
+        start = time.perf_counter()
+        vectorized = incremental_merges(tokenizer, word_freqs, args.merges, _NumpyMergeEngine)
+        numpy_time = time.perf_counter() - start
+        print(f"NumPy:       {numpy_time:8.3f} s ({len(vectorized) / numpy_time:9.1f} birleşdirme/s, "
+              f"köne usuldan {naive_time / numpy_time:.1f}x)")
+        if vectorized != expected:
+            print("❌ NumPy birleşdirmeleri gabat gelmeýär!")
+            sys.exit(1)
+    print(f"✓ {len(actual)} birleşdirme gabat gelýär")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+BPE öwrenişiniň ýat sarp edişini (peak RSS) ölçeýär.
+
+Söz ýygylyklary hasaplanandan soňky RSS bilen _MergeEngine gurlup
+birleşdirmeler tamamlanandan soňky iň ýokary RSS deňeşdirilýär.
+--synthetic bilen korpusdaky sözlerden millionlarça täze söz döredip bolýar.
+
+Ulanyş:
+    python benchmarks/bench_train_memory.py --merges 1000 --synthetic 1000000
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer, _MergeEngine  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield line.strip()
+
+
+def current_rss_mb():
+    """
+    Häzirki RSS (Linux-da /proc arkaly, beýleki ýerde iň ýokary RSS)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux-da KB, macOS-da baýt
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def synthetic_words(word_freqs, count, seed):
+    """
+    Korpusdaky iki sözi birleşdirip täze üýtgeşik sözler döredýär
+    """
+    rng = random.Random(seed)
+    words = [word for word in word_freqs if word.isalpha()]
+    result = {}
+    while len(result) < count:
+        word = rng.choice(words) + rng.choice(words)
+        if word not in word_freqs:
+            result[word] = rng.randint(1, 5)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--merges", type=int, default=1000)
+    parser.add_argument("--synthetic", type=int, default=0, help="goşmaça üýtgeşik söz sany")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tokenizer = TurkmenBPETokenizer()
+    word_freqs = tokenizer.get_word_frequencies(read_lines(args.corpus))
+    if args.synthetic:
+        word_freqs.update(synthetic_words(word_freqs, args.synthetic, args.seed))
+    print(f"Korpus: {args.corpus} ({len(word_freqs)} üýtgeşik söz)")
+
+    before = current_rss_mb()
+    start = time.perf_counter()
+    engine = _MergeEngine(word_freqs)
+    built = time.perf_counter()
+    merges = 0
+    for _ in range(args.merges):
+        best_pair = engine.best_pair()
+        if best_pair is None:
+            break
+        engine.merge(best_pair)
+        merges += 1
+    finished = time.perf_counter()
+
+    peak = peak_rss_mb()
+    print(f"Engine gurmak: {built - start:.2f} s, {merges} birleşdirme: {finished - built:.2f} s")
+    print(f"RSS söz ýygylyklaryndan soň: {before:8.1f} MB")
+    print(f"Iň ýokary RSS:               {peak:8.1f} MB")
+    print(f"Öwreniş üçin goşmaça:        {peak - before:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
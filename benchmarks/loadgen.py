@@ -0,0 +1,93 @@
+"""
+tokenizer_server.py üçin ýerli ýük generatory.
+
+Birnäçe keep-alive birikmesi bilen POST /encode soraglaryny iberýär,
+müşderi tarapyndaky öndürijiligi we gecikmäni (p50/p99) ölçeýär,
+soňra hyzmatyň /metrics netijesini görkezýär.
+
+Ulanyş:
+    python tokenizer_server.py --model turkmen_tokenizer.json --port 8080 &
+    python benchmarks/loadgen.py --port 8080 --connections 32 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                  ).encode('latin-1') + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers.get('content-length', 0)))
+    return int(status_line.split()[1]), json.loads(data.decode('utf-8'))
+
+
+async def client(host, port, lines, num_requests, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(num_requests):
+            started = time.perf_counter()
+            status, _ = await request(reader, writer, 'POST', '/encode', {'text': random.choice(lines)})
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100.0 * len(ordered)))]
+
+
+async def run(args):
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, lines, args.requests, latencies, errors)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - started
+
+    print(f"Soraglar: {len(latencies)} ({len(errors)} ýalňyş), {elapsed:.2f} s")
+    print(f"Öndürijilik: {len(latencies) / elapsed:.0f} sorag/s")
+    print(f"Müşderi gecikmesi: p50={percentile(latencies, 50) * 1000:.2f} ms "
+          f"p99={percentile(latencies, 99) * 1000:.2f} ms")
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, metrics = await request(reader, writer, 'GET', '/metrics')
+    writer.close()
+    print("Hyzmat metrikalary:", json.dumps(metrics, ensure_ascii=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="her birikme üçin")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Gaýtalanýan (reproducible) benchmark toplumy: öwreniş, encode/decode, ýüklemek we ýat.
+
+Her korpus ölçegi (scale) aýratyn prosesde ölçenýär - peak RSS diňe şol ölçege degişli.
+scale=1 esasy korpus, scale>1 bolsa korpusyň sintetik ulaldylan görnüşi
+(setirler garylýar we käbir sözlere goşulmalar goşulýar - täze üýtgeşik sözler döreýär).
+
+Ulanyş:
+    python benchmarks/suite.py run --output results.json --scales 1 2
+    python benchmarks/suite.py compare baseline.json results.json --threshold 0.10
+
+compare ýaramazlaşma (regression) tapsa 1 kody bilen çykýar.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bpetokenizer import TurkmenBPETokenizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, "all-raw-datas", "tmpoem2000.txt")
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux-da KB, macOS-da baýt
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100.0 * len(ordered)))]
+
+
+def synthetic_corpus(lines, scale, seed, path):
+    """
+    Korpusy scale gezek ulaldýar: birinji nusga üýtgewsiz, beýlekilerinde
+    sözler garylýar we käbir sözlere goşulma goşulýar
+    """
+    suffixes = sorted(TurkmenBPETokenizer().common_suffixes)
+    with open(path, "w", encoding="utf-8") as f:
+        for copy in range(scale):
+            rng = random.Random(seed + copy)
+            for line in lines:
+                if copy:
+                    words = line.split()
+                    rng.shuffle(words)
+                    line = " ".join(word + rng.choice(suffixes) if rng.random() < 0.3 else word
+                                    for word in words)
+                f.write(line + "\n")
+
+
+def time_calls(func, inputs):
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - start)
+    return {"p50_ms": percentile(latencies, 50) * 1000, "p99_ms": percentile(latencies, 99) * 1000}
+
+
+def run_scale(task):
+    """
+    Bir korpus ölçegi üçin ähli ölçegler (aýratyn prosesde işleýär)
+    """
+    corpus_path, vocab_size, repeat, seed = task
+    lines = read_lines(corpus_path)
+    result = {"lines": len(lines)}
+    rng = random.Random(seed)
+
+    # 1. Öwreniş - ädimler profiler arkaly
+    tokenizer = TurkmenBPETokenizer(vocab_size=vocab_size)
+    profiler = tokenizer.enable_profiling()
+    start = time.perf_counter()
+    tokenizer.train(corpus_path, verbose=False)
+    train_time = time.perf_counter() - start
+    tokenizer.disable_profiling()
+    timers = profiler.stats()["timers"]
+    merges = profiler.counters["train.merges"]
+    result["train"] = {
+        "total_sec": train_time,
+        "count_words_sec": timers["train.count_words"]["seconds"],
+        "count_pairs_sec": timers["train.count_pairs"]["seconds"],
+        "best_pair_sec": timers.get("train.best_pair", {}).get("seconds", 0.0),
+        "merge_sec": timers.get("train.merge", {}).get("seconds", 0.0),
+        "merges_per_sec": merges / max(timers.get("train.merge", {}).get("seconds", 0.0)
+                                       + timers.get("train.best_pair", {}).get("seconds", 0.0), 1e-9),
+        "unique_words": profiler.counters["train.unique_words"],
+        "merges": merges,
+    }
+
+    # 2. Encode/decode öndürijiligi (sowuk we ýyly keş)
+    tokenizer.clear_cache()
+    start = time.perf_counter()
+    encoded = [tokenizer.encode(line) for line in lines]
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    for line in lines:
+        tokenizer.encode(line)
+    warm = time.perf_counter() - start
+    num_tokens = sum(len(ids) for ids in encoded)
+    start = time.perf_counter()
+    for ids in encoded:
+        tokenizer.decode(ids)
+    decode_time = time.perf_counter() - start
+    result["throughput"] = {
+        "tokens": num_tokens,
+        "encode_cold_tokens_per_sec": num_tokens / cold,
+        "encode_warm_tokens_per_sec": num_tokens / warm,
+        "decode_tokens_per_sec": num_tokens / decode_time,
+    }
+
+    # 3. Gysga we uzyn girişleriň gecikmesi (arassa keş bilen)
+    short_inputs = rng.sample([line for line in lines if len(line.split()) <= 5] or lines,
+                              min(1000, len(lines)))
+    long_inputs = [" ".join(rng.sample(lines, min(50, len(lines)))) for _ in range(50)]
+    tokenizer.clear_cache()
+    result["latency_short"] = time_calls(tokenizer.encode, short_inputs)
+    tokenizer.clear_cache()
+    result["latency_long"] = time_calls(tokenizer.encode, long_inputs)
+
+    # 4. Ýüklemek wagty
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "model.json")
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                tokenizer.save(json_path)
+                load_times = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    TurkmenBPETokenizer().load(json_path)
+                    load_times.append(time.perf_counter() - start)
+            finally:
+                sys.stdout = stdout
+        result["load"] = {"json_ms": min(load_times) * 1000}
+
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    base_lines = read_lines(args.corpus)
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            corpus_path = args.corpus
+            if scale > 1:
+                corpus_path = os.path.join(tmp, f"corpus_x{scale}.txt")
+                synthetic_corpus(base_lines, scale, args.seed, corpus_path)
+            print(f"⏱ scale={scale} ölçenýär...")
+            # Her ölçeg arassa prosesde - peak RSS garyşmaz ýaly
+            with context.Pool(1) as pool:
+                result = pool.apply(run_scale, ((corpus_path, args.vocab_size, args.repeat, args.seed),))
+            results[f"scale_{scale}"] = result
+            print(f"  öwreniş {result['train']['total_sec']:.2f} s, "
+                  f"encode {result['throughput']['encode_cold_tokens_per_sec']:.0f} token/s, "
+                  f"peak RSS {result['peak_rss_mb']:.1f} MB")
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus": os.path.relpath(args.corpus, ROOT),
+            "vocab_size": args.vocab_size,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✓ Netijeler '{args.output}' faýlyna ýazyldy")
+
+
+def flatten(data, prefix=""):
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def higher_is_better(metric):
+    return metric.endswith("_per_sec")
+
+
+def is_measurement(metric):
+    # Sanlar (setir, token, birleşdirme) ölçeg däl - diňe wagt, tizlik we ýat
+    return metric.endswith(("_sec", "_ms", "_mb"))
+
+
+def compare(args):
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = flatten(json.load(f)["results"])
+    with open(args.current, "r", encoding="utf-8") as f:
+        current = flatten(json.load(f)["results"])
+
+    regressions = []
+    for metric in sorted(baseline.keys() & current.keys()):
+        if not is_measurement(metric):
+            continue
+        old, new = baseline[metric], current[metric]
+        if old == 0:
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better(metric) else change
+        flag = ""
+        if worse > args.threshold:
+            flag = "❌"
+            regressions.append(metric)
+        elif worse < -args.threshold:
+            flag = "✓"
+        print(f"{metric:<50} {old:>14.3f} {new:>14.3f} {change * 100:>+8.1f}% {flag}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} ýaramazlaşma (>{args.threshold * 100:.0f}%): {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\n✓ Ýaramazlaşma ýok (çäk {args.threshold * 100:.0f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmarklary işlet we JSON ýaz")
+    run_parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.add_argument("--scales", type=int, nargs="+", default=[1, 2])
+    run_parser.add_argument("--vocab-size", type=int, default=2000)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+
+    compare_parser = commands.add_parser("compare", help="iki netije faýlyny deňeşdir")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,293 +3,1056 @@ Türkmen Dili üçin BPE (Byte Pair Encoding) Tokenizer
 Grammatik düzümleri, adaty atlary we geografik atlary göz öňünde tutýar
 """
 
+import os
 import re
+import sys
 import json
-from collections import defaultdict, Counter
-from typing import List, Dict, Tuple, Set
+import time
+import gzip
+import zlib
+import struct
+from array import array
+import heapq
+import bisect
+import itertools
+import shutil
+import tempfile
+import multiprocessing
+import functools
+from collections import defaultdict, deque, Counter, OrderedDict
+from typing import List, Dict, Tuple, Set, Optional, Callable, Iterable
 import unicodedata
 
+
+# Söz harplary (regex harp toplumy görnüşinde)
+WORD_CHARS = "a-zäňöşüýžа-я"
+# Teksti sözlere, sanlara we nyşanlara bölýän regex
+TOKEN_PATTERN = rf"[{WORD_CHARS}]+|[0-9]+|[^\w\s]+"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+# train/resume_training checkpoint faýllarynyň formaty
+CHECKPOINT_FORMAT = 'tmbpe-checkpoint-v1'
+
+# encode_file meta faýlynyň formaty
+SHARD_FORMAT = 'tmbpe-shard-v1'
+
+# normalize_text üçin harp çalşyrma tablisasy (str.translate bilen bir geçişde)
+NORMALIZE_TABLE = str.maketrans({
+    "ÿ": "ý", "¥": "ý",  # Ýalňyş kodlanan ý-ler
+    "ə": "ä",            # Azeri/Tatar klawiaturasyndan galanlar
+    "s": "ş",            # Käwagt ş ýerine s ýazylýar (muňa seresap bolmaly)
+    "“": '"', "”": '"', "’": "'", "‘": "'",  # Dürli dyrnaklar
+    "\u00ad": None,      # Soft hyphen (görünmeýän kese çyzyk)
+    # "&nbsp;" öňki yzygiderli çalşyrmada hiç wagt tapylmaýardy: oňa çenli
+    # "s" eýýäm "ş" bolýardy. Netije üýtgemez ýaly ol bu ýerde ýok.
+})
+
+
+# Türkmen diliniň aýratyn harplary
+TURKMEN_CHARS = frozenset('äňöşüýž')
+
+# Türkmen erkek atlary
+MALE_NAMES = frozenset({
+    'ahmet', 'muhammet', 'döwlet', 'berdi', 'gurban', 'oraz', 'serdar',
+    'atamyrat', 'baýram', 'gurbanguly', 'görogly', 'käkä', 'magtymguly',
+    'oguz', 'saparmyrat', 'täçmyrat', 'wepa', 'ýagmyr', 'ýolaman',
+    'merdan', 'rustam', 'nurmuhammet', 'kerim', 'jumamyrat', 'annamuhammet',
+    'sapar', 'rejep', 'amanmyrat', 'myrat', 'guwanç', 'arslan',
+    'batyr', 'gökhan', 'hudaýberdi', 'mämmet', 'nazim', 'şöhrat',
+    'ýagşy', 'ýusup', 'ýusupmyrat', 'ýusupguly', 'ýusupgurly',
+    'anna', 'muhammetmyrat', 'muhammetguly', 'muhammetnur', 'muhammetöwez',
+    'muhammetrahman', 'muhammetserdar', 'muhammettaýly', 'muhammetýusup',
+    'myrat', 'nurmyrat', 'öwezmyrat', 'rahmanmyrat', 'serdarmyrat', 'täçmyrat',
+    'taýlymyrat', 'annamyrat', 'amanmyrat', 'gurbangulymyrat', 'guwançmyrat',
+    'hudaýberdimyrat', 'kerimmyrat', 'nazimmyrat', 'rejepmyrat', 'saparmyrat',
+    'şöhratmyrat', 'wepamyrat', 'ýagşymyrat', 'ýusupmyrat', 'ýusupgulymyrat',
+})
+
+# Türkmen zenan atlary
+FEMALE_NAMES = frozenset({
+    'aýna', 'oguljan', 'mahri', 'jennet', 'güllü', 'günä', 'güzel',
+    'lale', 'maýa', 'ogulnabat', 'sähet', 'soltan', 'aýgözel',
+    'aýjemal', 'bibigül', 'bibi', 'gülbahar', 'gülnara', 'jahan',
+    'leýla', 'maral', 'nazargül', 'rowaýat', 'şaýgül', 'täçgül',
+    'ýyldyz', 'zeýnep', 'gülşat', 'mahym', 'ogulnaz'
+})
+
+REGIONS = frozenset({
+    'aşgabat', 'ahal', 'balkan', 'daşoguz', 'lebap', 'mary', 'arkadag'
+})
+# Türkmenistanyň şäherleri we welaýatlary
+CITIES = frozenset({
+    # Paýtagt we Döwlet ähmiýetli şäherler
+    'aşgabat', 'arkadag',
+    
+    # Welaýat merkezleri
+    'anew', 'änew',             # Ahal
+    'balkanabat', 'nebitdag',   # Balkan (Köne ady: Nebitdag)
+    'daşoguz', 'daşhowuz',      # Daşoguz
+    'türkmenabat', 'çärjew',    # Lebap (Köne ady: Çärjew)
+    'mary',                     # Mary
+    
+    # Balkan welaýaty şäherleri
+    'türkmenbaşy', 'krasnowodsk',
+    'hazar', 'çeleken',
+    'gumdag',
+    'bereked', 'bereket', 'gazanjyk',
+    'gyzylarbat', 'serdar',     # Serdar şäheriniň ady Gyzylarbat boldy, ýöne ikisem gerek
+    'magtymguly', 'garrygala',
+    
+    # Daşoguz welaýaty şäherleri
+    'köneürgenç',
+    'akdepe',
+    'boldumsaz',
+    'gubadag',
+    'görogly', 'tagta',
+    
+    # Lebap welaýaty şäherleri
+    'kerki', 'atamyrat',        # Atamyrat ady ýatyryldy, ýöne tekstlerde köp
+    'gazojak',
+    'magdanly', 'gowurdak',
+    'seýdi', 'neftezawodsk',
+    'dänew', 'galkynyş',
+    'darganata', 'birata',
+    
+    # Mary welaýaty şäherleri
+    'baýramaly',
+    'ýolöten',
+    'murgap',
+    'serhetabat', 'guşgy',
+    'şatlyk',
+    
+    # Ahal welaýaty & Aşgabat düzümi (öňki şäherler)
+    'tejen',
+    'kaka', 'kaahka',
+    'sarahs',
+    'bäherden', 'baharly',
+    'gökdepe',
+    'abadan', 'büzmeýin',       # Häzir Aşgabadyň etraplary, ýöne şäher hökmünde duşýar
+    'arçabil'
+})
+
+DISTRICTS = frozenset({
+    # --- Aşgabat şäheriniň etraplary ---
+    'bagtyýarlyk',
+    'berkararlyk',
+    'büzmeýin',
+    'köpetdag',
+    # Ýatyrylan ýa-da birleşdirilen etraplar (taryhy tekstler üçin gerek)
+    'arçabil', 'çandybil', 'abadan', 'ruhabat',
+
+    # --- Arkadag şäheriniň etraplary ---
+    'kyarizek', 'kärizek',
+    'gorjaw',
+
+    # --- Ahal welaýaty ---
+    'ak bugdaý', 'akbugdaý',
+    'babadaýhan',
+    'bäherden', 'baharly',
+    'gökdepe',
+    'kaka', 'kaahka',
+    'sarahs',
+    'tejen',
+
+    # --- Balkan welaýaty ---
+    'bereket', 'gazanjyk',
+    'etrek', 'gyzyletrek',
+    'esenguly',
+    'magtymguly', 'garrygala',
+    'gyzylarbat', 'serdar',
+    'türkmenbaşy',
+
+    # --- Daşoguz welaýaty ---
+    'akdepe',
+    'boldumsaz',
+    'görogly', 'tagta',
+    'gubadag',
+    'köneürgenç',
+    'ruhubelent',
+    's.a.nyýazow', 'nyýazow',
+    'saparmyrat türkmenbaşy', 's.türkmenbaşy',
+
+    # --- Lebap welaýaty ---
+    'çärjew', 'serdarabat',     # Serdarabat etraby Çärjew boldy
+    'darganata', 'birata',
+    'dänew', 'galkynyş',
+    'halaç',
+    'hojambaz',
+    'kerki', 'atamyrat',
+    'köýtendag', 'çarşaňňy',
+    'saýat',
+    # Ýatyrylan ýa-da birleşen etraplar (tokenizer üçin saklamak peýdaly)
+    'döwletli', 'farap', 'garashsyzlyk', 'garaşsyzlyk', 'sakar', 'beýik türkmenbaşy',
+
+    # --- Mary welaýaty ---
+    'baýramaly',
+    'garagum',
+    'mary',
+    'murgap',
+    'oguzhan', 'oguz han',
+    'sakarçäge',
+    'serhetabat', 'guşgy',
+    'tagtabazar',
+    'türkmengala',
+    'wekilbazar',
+    'ýolöten',
+    # Ýatyrylanlar
+    'altyn sähra'
+})
+
+# Geografik atlar (daşary ýurt)
+COUNTRIES = frozenset({
+    'türkiýe', 'eýran', 'russiýa', 'gazagystan', 'özbegistan',
+    'täjigistan', 'owganystan', 'hytaý', 'hindistan', 'pakistan',
+    'azerbaýjan', 'gyrgyzystan', 'germaniýa', 'fransiýa', 'angliýa',
+    'amerika', 'kanada', 'braziliýa', 'awstraliýa', 'amerikanyň birleşen ştatlary'
+})
+
+# Beýleki möhüm sözler (ýokary ýygylykly)
+IMPORTANT_WORDS = frozenset({
+    'türkmenistan', 'türkmen', 'türkmenistanyň', 'türkmenleriň',
+    'garaşsyzlyk', 'bitaraplyk', 'prezident', 'halk', 'watan',
+    'döwlet', 'respublika', 'mejlis', 'ministr', 'ministrligi'
+})
+
+# Türkmen diliniň esasy goşulmalary (suffixes)
+_SUFFIX_LIST = [
+    # --- 4 Harp we uzynrak ---
+    'laryň', 'leriň', 'syzlyk', 'sizlik', 'darlyk', 'derlik',
+    'çylyk', 'çilik', 'kärlik', 'gerlik', 
+    'jakdyr', 'jekdir', 'maly', 'meli',
+    'ýarka', 'ýärkä', 'ýaka', 'ýäkä',
+    'madyk', 'medik', 'maly', 'meli',
+    
+    # --- 3 Harplylar ---
+    'lar', 'ler', 'dan', 'den', 'tan', 'ten',
+    'nyň', 'niň', 'nuň', 'nüň', # Eýelik düşüm (genitive) - Siziň sanawyňyzda ýokdy
+    'daş', 'deş', # Meselem: watan-daş
+    'lyk', 'lik', 'luk', 'lük', # At ýasaýjylar: gözellik
+    'syz', 'siz', # Sypat ýasaýjylar
+    'dar', 'gir', 'gor', # Meselem: bergidar
+    'ýar', 'ýär', 'ýor', 'ýör', # Häzirki zaman
+    'jak', 'jek', # Geljek zaman
+    'myş', 'miş', # Eşidilen geçen zaman
+    'dyr', 'dir', 'dur', 'dür', # Habar goşulmasy (Predicative)
+    'man', 'män', # Hal işlik (gelmän)
+    'maz', 'mez', # Inkär geljek zaman
+    'mak', 'mek', # Işlik düýbi (infinitive)
+    'yjy', 'iji', 'ujy', 'üji', # At ýasaýjy: oka-yjy
+    
+    # --- 2 Harplylar ---
+    'ny', 'ni', # Tabşyryş düşüm
+    'da', 'de', 'ta', 'te', # Wagt-orun düşüm
+    'ym', 'im', 'um', 'üm', # Meniň (I)
+    'yň', 'iň', 'uň', 'üň', # Seniň (II) we Eýelik düşüm gysgalan görnüşi
+    'sy', 'si', # Onuň (III)
+    'ka', 'kä', # Sorag/güman: barmyka?
+    'my', 'mi', # Sorag: barmy?
+    'ma', 'me', # Inkär: gelme
+    'yp', 'ip', 'up', 'üp', # Hal işlik: gelip
+    'an', 'en', # Sypat işlik: gelen
+    'dy', 'di', # Şaýatly geçen zaman
+    'çy', 'çi', # Kär aňladýan: balykçy
+    
+    # --- 1 Harplylar (Bular iň soňunda bolmaly) ---
+    'a', 'e', 'ä', # Gönükdirilen düşüm
+    'y', 'i', # Tabşyryş düşüm gysgalan
+]
+# Gaýtalanmaýan goşulmalar: uzynlaryndan gysgalaryna, deň uzynlykda elipbiý tertibinde
+COMMON_SUFFIXES = tuple(sorted(set(_SUFFIX_LIST), key=lambda suffix: (-len(suffix), suffix)))
+
+# Aýratyn tokenler (her nusga öz göçürmesini alýar)
+SPECIAL_TOKENS = {
+    # Standart tokenler
+    '<pad>': 0,    # Padding (Doldurgyç - uzynlygy deňlemek üçin)
+    '<unk>': 1,    # Unknown (Nätanyş söz)
+    '<bos>': 2,    # Beginning of Sentence (Sentensiýa başy - GPT üçin)
+    '<eos>': 3,    # End of Sentence (Sentensiýa soňy - GPT üçin)
+    
+    '<mask>': 4,   # Masked Language Modeling (MLM) üçin. Meselem: "Men <mask> gidýärin."
+    '<cls>': 5,    # Classification (Tekst klassifikasiýasy üçin başy)
+    '<sep>': 6,    # Separator (Iki sözlemi bölmek üçin. Meselem: Sorag <sep> Jogap)
+    
+    '<name>': 7,   
+    '<city>': 8,   
+    '<country>': 9,
+    '<num>': 10,   # Sanlary bellemek üçin (islege görä)
+    '<url>': 11,   # Linkleri bellemek üçin
+    '<email>': 12  # E-poçtalary bellemek üçin
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _gazetteer_table(important_words: frozenset, countries: frozenset, cities: frozenset,
+                     female_names: frozenset, male_names: frozenset) -> Dict[str, str]:
+    """
+    Ähli at sanawlary üçin bir tablisa: söz -> görnüş. Ileri tutulyşy
+    is_proper_noun-daky ýaly: adam ady > şäher > ýurt > möhüm söz.
+    Şol bir sanawlar üçin bir gezek gurulýar we nusgalaryň arasynda paýlaşylýar -
+    netijäni üýtgetmek bolmaz.
+    """
+    table = {}
+    for words, proper_type in ((important_words, 'important'),
+                               (countries, 'country'),
+                               (cities, 'city'),
+                               (female_names, 'name'),
+                               (male_names, 'name')):
+        for word in words:
+            table[word] = proper_type
+    return table
+
+
+@functools.lru_cache(maxsize=8)
+def _suffix_table(suffixes: Tuple[str, ...]) -> Tuple[frozenset, Tuple[int, ...]]:
+    """
+    Goşulmalar uzynlyk boýunça toparlanýar: her uzynlyk üçin bir set barlagy
+    """
+    suffix_set = frozenset(suffixes)
+    return suffix_set, tuple(sorted({len(suffix) for suffix in suffix_set}, reverse=True))
+
+
+def _entity_tokens(entry: str) -> Optional[Tuple[str, ...]]:
+    """
+    Köp sözli ady regex tokenlerine bölýär. Diňe at iki ýa-da has köp tokenden durýan
+    we tokenleri bir boşluk bilen birleşdirende özi alynýan bolsa (trie-e girýär)
+    """
+    tokens = tuple(TOKEN_RE.findall(entry))
+    if len(tokens) > 1 and ' '.join(tokens) == entry:
+        return tokens
+    return None
+
+
+def _trie_insert(trie: Dict, entries: Iterable[Tuple[Tuple[str, ...], Tuple[str, str]]],
+                 owned: Set[int]) -> Dict:
+    """
+    Köp sözli atlary trie-e goşýar we trie-ni gaýtarýar. owned - nusganyň özüne degişli
+    düwünleriň id-leri: olar ýerinde üýtgedilýär, paýlaşylýan düwünler (id-si owned-de ýok)
+    bolsa ýolda bir gezek göçürilýär - paýlaşylýan trie üýtgemeýär.
+    """
+    root = trie
+    if id(root) not in owned:
+        root = dict(root)
+        owned.add(id(root))
+    for tokens, entity in entries:
+        node = root
+        for token in tokens:
+            child = node.get(token)
+            if child is None or id(child) not in owned:
+                child = {} if child is None else dict(child)
+                owned.add(id(child))
+                node[token] = child
+            node = child
+        node[''] = entity
+    return root
+
+
+class _EntityStartFound(Exception):
+    """
+    pre_tokenize-yň çalt aýlawynda köp sözli atyň birinji sözi duşdy (args[0] - token)
+    """
+
+
+class _EntityStart:
+    """
+    _split_cache-däki bellik: token köp sözli atyň birinji sözi. Adaty bölekleri hem
+    saklaýar (at tapylmasa ulanylýar). pre_tokenize-yň çalt aýlawy ony extend edende
+    _EntityStartFound çykýar - şeýlelikde beýleki tokenler üçin goşmaça barlag ýok.
+    """
+    __slots__ = ('token', 'pieces')
+
+    def __init__(self, token: str, pieces: Tuple[Tuple[str, str], ...]):
+        self.token = token
+        self.pieces = pieces
+
+    def __iter__(self):
+        raise _EntityStartFound(self.token)
+
+
+@functools.lru_cache(maxsize=8)
+def _entity_trie(important_words: frozenset, countries: frozenset, cities: frozenset,
+                 female_names: frozenset, male_names: frozenset) -> Tuple[Dict, int]:
+    """
+    Köp sözli atlar üçin token derejesindäki trie: token -> çaga düwün,
+    '' açarynda bolsa (at, görnüş). Görnüş _gazetteer_table-daky ýaly saýlanýar.
+    Trie bilen iň uzyn atyň token sany gaýtarylýar.
+    Şol bir sanawlar üçin bir gezek gurulýar we nusgalaryň arasynda paýlaşylýar.
+    """
+    trie = {}
+    depth = 1
+    gazetteer = _gazetteer_table(important_words, countries, cities, female_names, male_names)
+    for entry, proper_type in gazetteer.items():
+        tokens = _entity_tokens(entry)
+        if tokens is None:
+            continue
+        node = trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[''] = (entry, proper_type)
+        depth = max(depth, len(tokens))
+    return trie, depth
+
+
+def _shared_words(words, default: frozenset) -> frozenset:
+    """
+    Sanaw adaty maglumat bilen deň bolsa, täze set döretmän modul derejesindäkini ulanýar
+    """
+    words = frozenset(words)
+    return default if words == default else words
+
+
+class _MergeEngine:
+    """
+    BPE öwrenişi üçin artýmly (incremental) jübüt hasaplaýjy.
+    Jübüt ýygylyklaryny, jübüt -> sözler indeksini we heap saklaýar,
+    her birleşdirmeden soň diňe şol jübüti öz içine alýan sözleri täzeleýär.
+
+    Tokenler bitewi san ID-lere (symbol id) öwrülýär: ähli sözleriň bölünişleri
+    bir tekiz array('i') buferinde, jübütler bolsa bir 64-bitlik san (a << 32 | b)
+    görnüşinde saklanýar. Setirler diňe birleşdirme netijesi üçin döredilýär.
+    Jübüt -> sözler indeksi hem array('i'): diňe goşulýar, köne ýazgylar
+    ulanylanda barlanyp geçilýär.
+
+    Deňlikde `max(pair_freqs, key=pair_freqs.get)` ýaly saýlaýar: jübütiň
+    korpusdaky ilkinji duşýan ýeri (söz indeksi, harp orny) kiçi bolsa öňde.
+    """
+
+    def __init__(self, word_freqs: Dict[str, int], splits: Optional[Dict[str, List[str]]] = None):
+        # ID -> token setiri, token setiri -> ID, ID -> setir uzynlygy
+        self.symbols = []
+        self.symbol_ids = {}
+        self.lengths = []
+        self.freqs = array('q', word_freqs.values())
+        # Söz bölünişleri: buffer[starts[i]:starts[i] + sizes[i]]
+        self.buffer = array('i')
+        self.starts = array('q')
+        self.sizes = array('i')
+        self.pair_counts = defaultdict(int)
+        self.pair_words = defaultdict(lambda: array('i'))
+        # Ilkinji duşýan ýeriň aşaky çägi: söz indeksi << 32 | harp orny
+        self.pair_keys = {}
+
+        intern = self._intern
+        for idx, word in enumerate(word_freqs):
+            if splits is None:
+                tokens = list(word[:-1])
+                if word:
+                    tokens.append(word[-1] + '</w>')
+            else:
+                tokens = splits[word]
+            split = [intern(token) for token in tokens]
+            self.starts.append(len(self.buffer))
+            self.sizes.append(len(split))
+            self.buffer.extend(split)
+
+            freq = self.freqs[idx]
+            offset = 0
+            seen = set()
+            for i in range(len(split) - 1):
+                pair = split[i] << 32 | split[i + 1]
+                self.pair_counts[pair] += freq
+                if pair not in seen:
+                    seen.add(pair)
+                    self.pair_words[pair].append(idx)
+                if pair not in self.pair_keys:
+                    self.pair_keys[pair] = idx << 32 | offset
+                offset += self.lengths[split[i]]
+
+        self.heap = [(-count, self.pair_keys[pair], pair)
+                     for pair, count in self.pair_counts.items()]
+        heapq.heapify(self.heap)
+
+    def _intern(self, token: str) -> int:
+        """
+        Token setiriniň ID-sini gaýtarýar (ýok bolsa täze ID berýär)
+        """
+        symbol = self.symbol_ids.get(token)
+        if symbol is None:
+            symbol = len(self.symbols)
+            self.symbol_ids[token] = symbol
+            self.symbols.append(token)
+            self.lengths.append(len(token))
+        return symbol
+
+    def _split(self, idx: int) -> array:
+        start = self.starts[idx]
+        return self.buffer[start:start + self.sizes[idx]]
+
+    def token_splits(self):
+        """
+        Häzirki bölünişleri token setirleri görnüşinde gaýtarýar (checkpoint üçin)
+        """
+        symbols = self.symbols
+        for idx in range(len(self.starts)):
+            yield [symbols[symbol] for symbol in self._split(idx)]
+
+    def _find(self, idx: int, first: int, second: int) -> Optional[int]:
+        """
+        Sözde jübütiň ilkinji harp ornuny gaýtarýar (ýok bolsa None)
+        """
+        split = self._split(idx)
+        lengths = self.lengths
+        offset = 0
+        for i in range(len(split) - 1):
+            if split[i] == first and split[i + 1] == second:
+                return offset
+            offset += lengths[split[i]]
+        return None
+
+    def _first_occurrence(self, pair: int) -> int:
+        """
+        Jübüt häzir korpusda ilkinji gezek nirede duşýar
+        """
+        first, second = pair >> 32, pair & 0xFFFFFFFF
+        words = self.pair_words[pair]
+        idx = min(words)
+        offset = self._find(idx, first, second)
+        if offset is not None:
+            return idx << 32 | offset
+
+        # Iň kiçi indeks köne - janly sözi tapyp, ondan kiçi ýazgylary aýyr
+        for idx in sorted(set(words)):
+            offset = self._find(idx, first, second)
+            if offset is not None:
+                self.pair_words[pair] = array('i', [i for i in words if i >= idx])
+                return idx << 32 | offset
+        raise KeyError(pair)
+
+    def best_pair(self) -> Optional[Tuple[str, str]]:
+        """
+        Iň ýygy jübüti gaýtarýar (ýok bolsa None)
+        """
+        heap = self.heap
+        while heap:
+            neg_count, key, pair = heap[0]
+            if self.pair_counts.get(pair, 0) != -neg_count:
+                # Köne ýazgy - taşla
+                heapq.heappop(heap)
+                continue
+            true_key = self._first_occurrence(pair)
+            if true_key != key:
+                self.pair_keys[pair] = true_key
+                heapq.heapreplace(heap, (neg_count, true_key, pair))
+                continue
+            return self.symbols[pair >> 32], self.symbols[pair & 0xFFFFFFFF]
+        return None
+
+    def pair_frequency(self, pair: Tuple[str, str]) -> int:
+        """
+        Jübütiň häzirki ýygylygy (korpusdaky sözleriň ýygylyklary bilen)
+        """
+        return self.pair_counts.get(self.symbol_ids[pair[0]] << 32 | self.symbol_ids[pair[1]], 0)
+
+    def merge(self, pair: Tuple[str, str]):
+        """
+        Jübüti diňe ony öz içine alýan sözlerde birleşdirýär
+        """
+        first = self.symbol_ids[pair[0]]
+        second = self.symbol_ids[pair[1]]
+        merged = self._intern(pair[0] + pair[1])
+        lengths = self.lengths
+        buffer = self.buffer
+        pair_keys = self.pair_keys
+        pair_words = self.pair_words
+        deltas = defaultdict(int)
+        lowered = set()
+
+        for idx in set(pair_words.pop(first << 32 | second, ())):
+            start = self.starts[idx]
+            n = self.sizes[idx]
+            split = buffer[start:start + n]
+
+            new_split = array('i')
+            i = 0
+            while i < n:
+                if i < n - 1 and split[i] == first and split[i + 1] == second:
+                    new_split.append(merged)
+                    i += 2
+                else:
+                    new_split.append(split[i])
+                    i += 1
+            if len(new_split) == n:
+                # Köne ýazgy - bu sözde jübüt eýýäm ýok
+                continue
+            buffer[start:start + len(new_split)] = new_split
+            self.sizes[idx] = len(new_split)
+
+            freq = self.freqs[idx]
+            old_pairs = set()
+            for i in range(n - 1):
+                old_pair = split[i] << 32 | split[i + 1]
+                deltas[old_pair] -= freq
+                old_pairs.add(old_pair)
+
+            new_pairs = set()
+            offset = 0
+            base = idx << 32
+            for i in range(len(new_split) - 1):
+                new_pair = new_split[i] << 32 | new_split[i + 1]
+                deltas[new_pair] += freq
+                new_pairs.add(new_pair)
+                key = base | offset
+                old_key = pair_keys.get(new_pair)
+                if old_key is None or key < old_key:
+                    pair_keys[new_pair] = key
+                    lowered.add(new_pair)
+                offset += lengths[new_split[i]]
+
+            for new_pair in new_pairs - old_pairs:
+                pair_words[new_pair].append(idx)
+
+        for changed, delta in deltas.items():
+            if delta == 0 and changed not in lowered:
+                continue
+            count = self.pair_counts[changed] + delta
+            if count <= 0:
+                self.pair_counts.pop(changed, None)
+                pair_words.pop(changed, None)
+                pair_keys.pop(changed, None)
+                continue
+            self.pair_counts[changed] = count
+            heapq.heappush(self.heap, (-count, pair_keys[changed], changed))
+
+
+class _NumpyMergeEngine:
+    """
+    _MergeEngine bilen birmeňzeş interfeýsli we birmeňzeş netijeli NumPy engine
+    (train(..., backend='numpy')).
+
+    Ähli sözleriň bölünişleri bir tekiz int32 simwol massiwinde saklanýar, sözleriň
+    arasynda -1 serhet belgisi bar; her orun üçin (söz indeksi << 32 | harp orny) hem saklanýar.
+    Jübütler 64-bitlik san (a << 32 | b), ýygylyklar np.unique + agramly np.bincount
+    bilen hasaplanýar. Birleşdirme maska bilen ýerine ýetirilýär we diňe üýtgän
+    ýerleriň jübütleri täzelenýär. Deňlikde saýlaw _MergeEngine-däki ýaly.
+    """
+
+    def __init__(self, word_freqs: Dict[str, int], splits: Optional[Dict[str, List[str]]] = None):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("backend='numpy' üçin 'numpy' kitaphanasy gerek ('pip install numpy').")
+        self.np = np
+        self.symbols = []
+        self.symbol_ids = {}
+
+        if splits is None:
+            self._split_chars(word_freqs)
+        else:
+            intern = self._intern
+            seq, positions = array('i'), array('q')
+            for idx, word in enumerate(word_freqs):
+                offset = idx << 32
+                for token in splits[word]:
+                    seq.append(intern(token))
+                    positions.append(offset)
+                    offset += len(token)
+                # Söz serhedi: -1 bilen jübüt döremeýär
+                seq.append(-1)
+                positions.append(offset)
+            self.seq = np.array(seq, dtype=np.int32)
+            # Ilkinji duşýan ýeri deňeşdirmek üçin açar: söz indeksi << 32 | harp orny
+            self.position_keys = np.array(positions, dtype=np.int64)
+        self.weights = np.fromiter(word_freqs.values(), dtype=np.int64, count=len(word_freqs))
+        # Soňky gözlegiň netijesi: (jübüt, orunlar) - best_pair we merge üçin
+        self._hits = (None, None)
+
+        keys, weights, positions = self._pairs_at(np.arange(max(len(self.seq) - 1, 0)))
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        counts = np.rint(np.bincount(inverse, weights=weights)).astype(np.int64)
+        first_keys = self.position_keys[positions[first]]
+        self.pair_counts = dict(zip(unique.tolist(), counts.tolist()))
+        # Ilkinji duşýan ýeriň aşaky çägi: söz indeksi << 32 | harp orny
+        self.pair_keys = dict(zip(unique.tolist(), first_keys.tolist()))
+        self.heap = [(-count, self.pair_keys[pair], pair) for pair, count in self.pair_counts.items()]
+        heapq.heapify(self.heap)
+
+    def _split_chars(self, word_freqs: Dict[str, int]):
+        """
+        Sözleri harplara bölýär (split_word_to_chars ýaly, soňky harp + '</w>')
+        Python aýlawsyz: ähli sözler bir UTF-32 massiwine öwrülýär
+        """
+        np = self.np
+        num_words = len(word_freqs)
+        lengths = np.fromiter(map(len, word_freqs), dtype=np.int64, count=num_words)
+        codes = np.frombuffer(''.join(word_freqs).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        starts = np.cumsum(lengths) - lengths
+        is_last = np.zeros(len(codes), dtype=np.int64)
+        is_last[(starts + lengths - 1)[lengths > 0]] = 1
+        unique, symbols = np.unique(codes * 2 + is_last, return_inverse=True)
+        for code in unique.tolist():
+            self._intern(chr(code >> 1) + ('</w>' if code & 1 else ''))
+
+        # Her sözden soň -1 serhet belgisi
+        separators = starts + lengths + np.arange(num_words)
+        chars = np.ones(len(codes) + num_words, dtype=bool)
+        chars[separators] = False
+        self.seq = np.full(len(chars), -1, dtype=np.int32)
+        self.seq[chars] = symbols
+        word_index = np.repeat(np.arange(num_words, dtype=np.int64), lengths + 1)
+        self.position_keys = word_index << 32 | (np.arange(len(chars)) - (starts + np.arange(num_words))[word_index])
+
+    def _intern(self, token: str) -> int:
+        symbol = self.symbol_ids.get(token)
+        if symbol is None:
+            symbol = len(self.symbols)
+            self.symbol_ids[token] = symbol
+            self.symbols.append(token)
+        return symbol
+
+    def _pairs_at(self, positions):
+        """
+        Berlen orunlarda başlaýan jübütler (serhetdäkiler aýrylýar): açarlar, agramlar, orunlar
+        """
+        np = self.np
+        left = self.seq[positions]
+        right = self.seq[positions + 1]
+        valid = (left >= 0) & (right >= 0)
+        positions = positions[valid]
+        keys = left[valid].astype(np.int64) << 32 | right[valid].astype(np.int64)
+        return keys, self.weights[self.position_keys[positions] >> 32], positions
+
+    def _find(self, pair: int):
+        """
+        Jübütiň ähli orunlary (çep tarapdan, biri-birini ýapmaýan)
+        """
+        np = self.np
+        if self._hits[0] == pair:
+            return self._hits[1]
+        first, second = pair >> 32, pair & 0xFFFFFFFF
+        seq = self.seq
+        hits = np.flatnonzero(seq[:-1] == first)
+        hits = hits[seq[hits + 1] == second]
+        if first == second and len(hits) > 1:
+            # "a a a" - yzygiderli orunlarda diňe her ikinjisi (merge_pair ýaly)
+            run_starts = np.flatnonzero(np.diff(hits, prepend=-2) != 1)
+            run_index = np.cumsum(np.diff(hits, prepend=-2) != 1) - 1
+            hits = hits[(np.arange(len(hits)) - run_starts[run_index]) % 2 == 0]
+        self._hits = (pair, hits)
+        return hits
+
+    def token_splits(self):
+        """
+        Häzirki bölünişleri token setirleri görnüşinde gaýtarýar (checkpoint üçin)
+        """
+        symbols = self.symbols
+        split = []
+        for symbol in self.seq.tolist():
+            if symbol < 0:
+                yield split
+                split = []
+            else:
+                split.append(symbols[symbol])
+
+    def best_pair(self) -> Optional[Tuple[str, str]]:
+        """
+        Iň ýygy jübüti gaýtarýar (ýok bolsa None)
+        """
+        heap = self.heap
+        while heap:
+            neg_count, key, pair = heap[0]
+            if self.pair_counts.get(pair, 0) != -neg_count:
+                heapq.heappop(heap)
+                continue
+            true_key = int(self.position_keys[self._find(pair)[0]])
+            if true_key != key:
+                self.pair_keys[pair] = true_key
+                heapq.heapreplace(heap, (neg_count, true_key, pair))
+                continue
+            return self.symbols[pair >> 32], self.symbols[pair & 0xFFFFFFFF]
+        return None
+
+    def pair_frequency(self, pair: Tuple[str, str]) -> int:
+        return self.pair_counts.get(self.symbol_ids[pair[0]] << 32 | self.symbol_ids[pair[1]], 0)
+
+    def merge(self, pair: Tuple[str, str]):
+        """
+        Jübüti ähli orunlarda birden birleşdirýär we diňe üýtgän jübütleri täzeleýär
+        """
+        np = self.np
+        first = self.symbol_ids[pair[0]]
+        second = self.symbol_ids[pair[1]]
+        merged = self._intern(pair[0] + pair[1])
+        hits = self._find(first << 32 | second)
+        self._hits = (None, None)
+        if not len(hits):
+            return
+        last = len(self.seq) - 2
+
+        # Köne jübütler: (çep, a), (a, b), (b, sag)
+        starts = np.unique(np.concatenate((hits - 1, hits, hits + 1)))
+        old_keys, old_weights, _ = self._pairs_at(starts[(starts >= 0) & (starts <= last)])
+
+        keep = np.ones(len(self.seq), dtype=bool)
+        keep[hits + 1] = False
+        self.seq[hits] = merged
+        self.seq = self.seq[keep]
+        self.position_keys = self.position_keys[keep]
+
+        # Täze jübütler: (çep, ab), (ab, sag)
+        new_hits = hits - np.arange(len(hits))
+        starts = np.unique(np.concatenate((new_hits - 1, new_hits)))
+        new_keys, new_weights, new_positions = self._pairs_at(starts[(starts >= 0) & (starts <= last - len(hits))])
+
+        unique, inverse = np.unique(np.concatenate((new_keys, old_keys)), return_inverse=True)
+        deltas = np.rint(np.bincount(inverse, weights=np.concatenate((new_weights, -old_weights)),
+                                     minlength=len(unique))).astype(np.int64)
+        added, added_first = np.unique(new_keys, return_index=True)
+        added_keys = dict(zip(added.tolist(), self.position_keys[new_positions[added_first]].tolist()))
+
+        pair_counts = self.pair_counts
+        pair_keys = self.pair_keys
+        for changed, delta in zip(unique.tolist(), deltas.tolist()):
+            key = added_keys.get(changed)
+            old_key = pair_keys.get(changed)
+            lowered = key is not None and (old_key is None or key < old_key)
+            if lowered:
+                pair_keys[changed] = key
+            if delta == 0 and not lowered:
+                continue
+            count = pair_counts.get(changed, 0) + delta
+            if count <= 0:
+                pair_counts.pop(changed, None)
+                pair_keys.pop(changed, None)
+                continue
+            pair_counts[changed] = count
+            heapq.heappush(self.heap, (-count, pair_keys[changed], changed))
+
+
+class Profiler:
+    """
+    Tokenizer üçin opt-in ölçeýji: ädim taýmerleri, hasaplaýjylar we wakalar (events).
+    Öçürilen ýagdaýynda tokenizer diňe `self.profiler is None` barlagyny edýär.
+    callback berilse, train wakalary (merge_progress, checkpoint, train_done)
+    sözlük görnüşinde şoňa iberilýär.
+    """
+
+    def __init__(self, callback: Optional[Callable[[Dict], None]] = None):
+        self.callback = callback
+        self.timers = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+
+    def add_time(self, stage: str, seconds: float):
+        self.timers[stage] += seconds
+        self.calls[stage] += 1
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def stats(self) -> Dict:
+        """
+        Häzirki ýagdaýyň göçürmesi (snapshot)
+        """
+        return {
+            'timers': {stage: {'seconds': seconds, 'calls': self.calls[stage]}
+                       for stage, seconds in self.timers.items()},
+            'counters': dict(self.counters),
+        }
+
+    def reset(self):
+        self.timers.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+
+def _print_event(event: Dict):
+    """
+    train wakalaryny konsola ýazýan adaty callback (verbose=True)
+    """
+    if event['event'] == 'merge_progress':
+        first, second = event['pair']
+        print(f"  {event['step']}/{event['total']} birleşdirme tamamlandy - "
+              f"Iň soňky: {first} + {second} = {event['token']} "
+              f"({event['merges_per_sec']:.0f} birleşdirme/s, galan wagt ~{event['eta_sec']:.0f} s)")
+    elif event['event'] == 'checkpoint':
+        print(f"  💾 {event['step']} birleşdirmeden soň checkpoint saklandy")
+
+
 class TurkmenBPETokenizer:
-    def __init__(self, vocab_size: int = 10000):
+    def __init__(self, vocab_size: int = 10000, cache_size: int = 10000, normalize: bool = False,
+                 split_cache_size: int = 100000):
+        self._init_attributes(vocab_size, cache_size, normalize, split_cache_size)
+        self._refresh_tables()
+
+    def _init_attributes(self, vocab_size: int, cache_size: int, normalize: bool, split_cache_size: int):
+        """
+        Nusganyň atributlary (tablisalarsyz) - from_file tablisalary diňe bir gezek,
+        ýüklenen ýagdaýdan gurar ýaly __init__-den aýry
+        """
         self.vocab_size = vocab_size
+        # pre_tokenize-dan öň normalize_text ulanylsynmy
+        self.normalize = normalize
+        # Söz derejesinde LRU keş: (söz, görnüş) -> (tokenler, ID-ler)
+        self.cache_size = cache_size
+        self._word_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        # pre_tokenize keşi: regex sözi -> görnüşli bölekler (_split_token netijesi).
+        # Doldugy soň täze söz goşulmaýar, okalanda hem üýtgemeýär - şonuň üçin
+        # fork bilen işçilere geçende diňe okalýan hökmünde paýlaşylýar.
+        self.split_cache_size = split_cache_size
+        self._split_cache = {}
         self.vocab = {}
         self.merges = []
         self.word_freqs = {}
         
-        # Türkmen diliniň aýratyn harplary
-        self.turkmen_chars = set('äňöşüýž')
-        
-        # Türkmen erkek atlary
-        self.male_names = {
-            'ahmet', 'muhammet', 'döwlet', 'berdi', 'gurban', 'oraz', 'serdar',
-            'atamyrat', 'baýram', 'gurbanguly', 'görogly', 'käkä', 'magtymguly',
-            'oguz', 'saparmyrat', 'täçmyrat', 'wepa', 'ýagmyr', 'ýolaman',
-            'merdan', 'rustam', 'nurmuhammet', 'kerim', 'jumamyrat', 'annamuhammet',
-            'sapar', 'rejep', 'amanmyrat', 'myrat', 'guwanç', 'arslan',
-            'batyr', 'gökhan', 'hudaýberdi', 'mämmet', 'nazim', 'şöhrat',
-            'ýagşy', 'ýusup', 'ýusupmyrat', 'ýusupguly', 'ýusupgurly',
-            'anna', 'muhammetmyrat', 'muhammetguly', 'muhammetnur', 'muhammetöwez',
-            'muhammetrahman', 'muhammetserdar', 'muhammettaýly', 'muhammetýusup',
-            'myrat', 'nurmyrat', 'öwezmyrat', 'rahmanmyrat', 'serdarmyrat', 'täçmyrat',
-            'taýlymyrat', 'annamyrat', 'amanmyrat', 'gurbangulymyrat', 'guwançmyrat',
-            'hudaýberdimyrat', 'kerimmyrat', 'nazimmyrat', 'rejepmyrat', 'saparmyrat',
-            'şöhratmyrat', 'wepamyrat', 'ýagşymyrat', 'ýusupmyrat', 'ýusupgulymyrat',
-        }
-        
-        # Türkmen zenan atlary
-        self.female_names = {
-            'aýna', 'oguljan', 'mahri', 'jennet', 'güllü', 'günä', 'güzel',
-            'lale', 'maýa', 'ogulnabat', 'sähet', 'soltan', 'aýgözel',
-            'aýjemal', 'bibigül', 'bibi', 'gülbahar', 'gülnara', 'jahan',
-            'leýla', 'maral', 'nazargül', 'rowaýat', 'şaýgül', 'täçgül',
-            'ýyldyz', 'zeýnep', 'gülşat', 'mahym', 'ogulnaz'
-        }
-        
-        self.regions = {
-            'aşgabat', 'ahal', 'balkan', 'daşoguz', 'lebap', 'mary', 'arkadag'
-        }
-        # Türkmenistanyň şäherleri we welaýatlary
-        self.cities = {
-            # Paýtagt we Döwlet ähmiýetli şäherler
-            'aşgabat', 'arkadag',
-            
-            # Welaýat merkezleri
-            'anew', 'änew',             # Ahal
-            'balkanabat', 'nebitdag',   # Balkan (Köne ady: Nebitdag)
-            'daşoguz', 'daşhowuz',      # Daşoguz
-            'türkmenabat', 'çärjew',    # Lebap (Köne ady: Çärjew)
-            'mary',                     # Mary
-            
-            # Balkan welaýaty şäherleri
-            'türkmenbaşy', 'krasnowodsk',
-            'hazar', 'çeleken',
-            'gumdag',
-            'bereked', 'bereket', 'gazanjyk',
-            'gyzylarbat', 'serdar',     # Serdar şäheriniň ady Gyzylarbat boldy, ýöne ikisem gerek
-            'magtymguly', 'garrygala',
-            
-            # Daşoguz welaýaty şäherleri
-            'köneürgenç',
-            'akdepe',
-            'boldumsaz',
-            'gubadag',
-            'görogly', 'tagta',
-            
-            # Lebap welaýaty şäherleri
-            'kerki', 'atamyrat',        # Atamyrat ady ýatyryldy, ýöne tekstlerde köp
-            'gazojak',
-            'magdanly', 'gowurdak',
-            'seýdi', 'neftezawodsk',
-            'dänew', 'galkynyş',
-            'darganata', 'birata',
-            
-            # Mary welaýaty şäherleri
-            'baýramaly',
-            'ýolöten',
-            'murgap',
-            'serhetabat', 'guşgy',
-            'şatlyk',
-            
-            # Ahal welaýaty & Aşgabat düzümi (öňki şäherler)
-            'tejen',
-            'kaka', 'kaahka',
-            'sarahs',
-            'bäherden', 'baharly',
-            'gökdepe',
-            'abadan', 'büzmeýin',       # Häzir Aşgabadyň etraplary, ýöne şäher hökmünde duşýar
-            'arçabil'
-        }
+        # Dil maglumatlary modul derejesindäki frozenset-ler: ähli nusgalar bir nusgany
+        # paýlaşýar, add_names/add_cities diňe üýtgedilýän sanawyň täze göçürmesini döredýär
+        self.turkmen_chars = TURKMEN_CHARS
+        self.male_names = MALE_NAMES
+        self.female_names = FEMALE_NAMES
+        self.regions = REGIONS
+        self.cities = CITIES
+        self.districts = DISTRICTS
+        self.countries = COUNTRIES
+        self.important_words = IMPORTANT_WORDS
+        self.common_suffixes = COMMON_SUFFIXES
+        self.special_tokens = dict(SPECIAL_TOKENS)
+        # Köp sözli atlaryň trie-si we iň uzyn atyň token sany
+        # (_refresh_tables gurýar, add_names/add_cities artýmly täzeleýär)
+        self._entity_trie = None
+        self._entity_depth = 1
+        # Trie-de şu nusganyň özi döreden düwünleri (id) - olar ýerinde üýtgedilýär
+        self._entity_owned = set()
+        # _gazetteer _gazetteer_table keşinden gelýär (paýlaşylýar) - üýtgetmezden öň göçürilýär
+        self._gazetteer_shared = True
+        # Tablisalar her üýtgände artýar (DocumentSession köne tablisalary şonuň bilen tanaýar)
+        self._tables_version = 0
 
-        self.districts = {
-            # --- Aşgabat şäheriniň etraplary ---
-            'bagtyýarlyk',
-            'berkararlyk',
-            'büzmeýin',
-            'köpetdag',
-            # Ýatyrylan ýa-da birleşdirilen etraplar (taryhy tekstler üçin gerek)
-            'arçabil', 'çandybil', 'abadan', 'ruhabat',
-
-            # --- Arkadag şäheriniň etraplary ---
-            'kyarizek', 'kärizek',
-            'gorjaw',
-
-            # --- Ahal welaýaty ---
-            'ak bugdaý', 'akbugdaý',
-            'babadaýhan',
-            'bäherden', 'baharly',
-            'gökdepe',
-            'kaka', 'kaahka',
-            'sarahs',
-            'tejen',
-
-            # --- Balkan welaýaty ---
-            'bereket', 'gazanjyk',
-            'etrek', 'gyzyletrek',
-            'esenguly',
-            'magtymguly', 'garrygala',
-            'gyzylarbat', 'serdar',
-            'türkmenbaşy',
-
-            # --- Daşoguz welaýaty ---
-            'akdepe',
-            'boldumsaz',
-            'görogly', 'tagta',
-            'gubadag',
-            'köneürgenç',
-            'ruhubelent',
-            's.a.nyýazow', 'nyýazow',
-            'saparmyrat türkmenbaşy', 's.türkmenbaşy',
-
-            # --- Lebap welaýaty ---
-            'çärjew', 'serdarabat',     # Serdarabat etraby Çärjew boldy
-            'darganata', 'birata',
-            'dänew', 'galkynyş',
-            'halaç',
-            'hojambaz',
-            'kerki', 'atamyrat',
-            'köýtendag', 'çarşaňňy',
-            'saýat',
-            # Ýatyrylan ýa-da birleşen etraplar (tokenizer üçin saklamak peýdaly)
-            'döwletli', 'farap', 'garashsyzlyk', 'garaşsyzlyk', 'sakar', 'beýik türkmenbaşy',
-
-            # --- Mary welaýaty ---
-            'baýramaly',
-            'garagum',
-            'mary',
-            'murgap',
-            'oguzhan', 'oguz han',
-            'sakarçäge',
-            'serhetabat', 'guşgy',
-            'tagtabazar',
-            'türkmengala',
-            'wekilbazar',
-            'ýolöten',
-            # Ýatyrylanlar
-            'altyn sähra'
-        }
-        
-        # Geografik atlar (daşary ýurt)
-        self.countries = {
-            'türkiýe', 'eýran', 'russiýa', 'gazagystan', 'özbegistan',
-            'täjigistan', 'owganystan', 'hytaý', 'hindistan', 'pakistan',
-            'azerbaýjan', 'gyrgyzystan', 'germaniýa', 'fransiýa', 'angliýa',
-            'amerika', 'kanada', 'braziliýa', 'awstraliýa', 'amerikanyň birleşen ştatlary'
-        }
-        
-        # Beýleki möhüm sözler (ýokary ýygylykly)
-        self.important_words = {
-            'türkmenistan', 'türkmen', 'türkmenistanyň', 'türkmenleriň',
-            'garaşsyzlyk', 'bitaraplyk', 'prezident', 'halk', 'watan',
-            'döwlet', 'respublika', 'mejlis', 'ministr', 'ministrligi'
-        }
-        
-        # Türkmen diliniň esasy goşulmalary (suffixes)
-        self.common_suffixes = [
-            # --- 4 Harp we uzynrak ---
-            'laryň', 'leriň', 'syzlyk', 'sizlik', 'darlyk', 'derlik',
-            'çylyk', 'çilik', 'kärlik', 'gerlik', 
-            'jakdyr', 'jekdir', 'maly', 'meli',
-            'ýarka', 'ýärkä', 'ýaka', 'ýäkä',
-            'madyk', 'medik', 'maly', 'meli',
-            
-            # --- 3 Harplylar ---
-            'lar', 'ler', 'dan', 'den', 'tan', 'ten',
-            'nyň', 'niň', 'nuň', 'nüň', # Eýelik düşüm (genitive) - Siziň sanawyňyzda ýokdy
-            'daş', 'deş', # Meselem: watan-daş
-            'lyk', 'lik', 'luk', 'lük', # At ýasaýjylar: gözellik
-            'syz', 'siz', # Sypat ýasaýjylar
-            'dar', 'gir', 'gor', # Meselem: bergidar
-            'ýar', 'ýär', 'ýor', 'ýör', # Häzirki zaman
-            'jak', 'jek', # Geljek zaman
-            'myş', 'miş', # Eşidilen geçen zaman
-            'dyr', 'dir', 'dur', 'dür', # Habar goşulmasy (Predicative)
-            'man', 'män', # Hal işlik (gelmän)
-            'maz', 'mez', # Inkär geljek zaman
-            'mak', 'mek', # Işlik düýbi (infinitive)
-            'yjy', 'iji', 'ujy', 'üji', # At ýasaýjy: oka-yjy
-            
-            # --- 2 Harplylar ---
-            'ny', 'ni', # Tabşyryş düşüm
-            'da', 'de', 'ta', 'te', # Wagt-orun düşüm
-            'ym', 'im', 'um', 'üm', # Meniň (I)
-            'yň', 'iň', 'uň', 'üň', # Seniň (II) we Eýelik düşüm gysgalan görnüşi
-            'sy', 'si', # Onuň (III)
-            'ka', 'kä', # Sorag/güman: barmyka?
-            'my', 'mi', # Sorag: barmy?
-            'ma', 'me', # Inkär: gelme
-            'yp', 'ip', 'up', 'üp', # Hal işlik: gelip
-            'an', 'en', # Sypat işlik: gelen
-            'dy', 'di', # Şaýatly geçen zaman
-            'çy', 'çi', # Kär aňladýan: balykçy
-            
-            # --- 1 Harplylar (Bular iň soňunda bolmaly) ---
-            'a', 'e', 'ä', # Gönükdirilen düşüm
-            'y', 'i', # Tabşyryş düşüm gysgalan
-        ]
-        self.common_suffixes = sorted(list(set(self.common_suffixes)), key=len, reverse=True)
-        # Aýratyn tokenler
-        self.special_tokens = {
-            # Standart tokenler
-            '<pad>': 0,    # Padding (Doldurgyç - uzynlygy deňlemek üçin)
-            '<unk>': 1,    # Unknown (Nätanyş söz)
-            '<bos>': 2,    # Beginning of Sentence (Sentensiýa başy - GPT üçin)
-            '<eos>': 3,    # End of Sentence (Sentensiýa soňy - GPT üçin)
-            
-            '<mask>': 4,   # Masked Language Modeling (MLM) üçin. Meselem: "Men <mask> gidýärin."
-            '<cls>': 5,    # Classification (Tekst klassifikasiýasy üçin başy)
-            '<sep>': 6,    # Separator (Iki sözlemi bölmek üçin. Meselem: Sorag <sep> Jogap)
-            
-            '<name>': 7,   
-            '<city>': 8,   
-            '<country>': 9,
-            '<num>': 10,   # Sanlary bellemek üçin (islege görä)
-            '<url>': 11,   # Linkleri bellemek üçin
-            '<email>': 12  # E-poçtalary bellemek üçin
+        # Birleşdirmeleriň tertibi: jübüt -> rank (tokenize üçin)
+        self.merge_ranks = {}
+        # encode_batch/decode_batch üçin işçi prosesler (ýalta döredilýär)
+        self._pool = None
+        self._pool_workers = 0
+        # Opt-in ölçeýji (enable_profiling); None bolsa hiç hili çykdajy ýok
+        self.profiler = None
+
+    def _refresh_tables(self):
+        """
+        Söz kitabyndan we birleşdirmelerden alynýan kömekçi tablisalary täzeden gurýar.
+        train/load soňunda çagyrylýar (add_names/add_cities _add_gazetteer_words bilen artýmly).
+        """
+        self.merge_ranks = {}
+        for rank, merge in enumerate(self.merges):
+            self.merge_ranks.setdefault(tuple(merge), rank)
+
+        # ID -> token ters tablisasy (decode üçin). Aýratyn tokenler we
+        # boş ID-ler '' bolýar - olar decode-da aýrylýar.
+        size = max(self.vocab.values(), default=-1) + 1
+        self._decode_table = [''] * size
+        for token, idx in self.vocab.items():
+            self._decode_table[idx] = '' if token in self.special_tokens else token
+
+        # Ähli at sanawlary üçin bir tablisa (adaty sanawlar üçin paýlaşylýar)
+        self._gazetteer = _gazetteer_table(
+            frozenset(self.important_words), frozenset(self.countries), frozenset(self.cities),
+            frozenset(self.female_names), frozenset(self.male_names))
+        self._gazetteer_shared = True
+        # Tutuş söz tokeni söz kitabynda bar bolsa, onuň ID-si: söz -> ID
+        self._gazetteer_ids = {}
+        for word in self._gazetteer:
+            token_id = self.vocab.get(word + '</w>')
+            if token_id is not None:
+                self._gazetteer_ids[word] = token_id
+        if self._entity_trie is None:
+            self._entity_trie, self._entity_depth = _entity_trie(
+                frozenset(self.important_words), frozenset(self.countries), frozenset(self.cities),
+                frozenset(self.female_names), frozenset(self.male_names))
+            self._entity_owned = set()
+
+        # Goşulmalar uzynlyk boýunça toparlanýar: her uzynlyk üçin bir set barlagy
+        self._suffix_set, self._suffix_lengths = _suffix_table(tuple(self.common_suffixes))
+
+        # Köne segmentasiýalar indi dogry däl
+        self._word_cache.clear()
+        self._split_cache = {}
+        # Işçilerdäki tokenizer nusgalary hem köneldi
+        self.close_pool()
+        self._tables_version += 1
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Söz keşiniň statistikasyny gaýtarýar
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'evictions': self.cache_evictions,
+            'size': len(self._word_cache),
+            'maxsize': self.cache_size,
+            'split_size': len(self._split_cache),
+            'split_maxsize': self.split_cache_size,
         }
-        
+
+    def enable_profiling(self, callback: Optional[Callable[[Dict], None]] = None) -> Profiler:
+        """
+        Ädim taýmerlerini we hasaplaýjylary açýar.
+        callback berilse, train wakalary print ýerine şoňa iberilýär.
+        """
+        self.profiler = Profiler(callback)
+        # Ölçenýän görnüşler diňe şu nusga üçin goýulýar - öçük wagty
+        # pre_tokenize/tokenize/encode hiç hili barlag etmeýär
+        self.pre_tokenize = self._pre_tokenize_profiled
+        self.tokenize = self._tokenize_profiled
+        self.encode = self._encode_profiled
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+        for name in ('pre_tokenize', 'tokenize', 'encode'):
+            self.__dict__.pop(name, None)
+
+    def stats(self) -> Dict:
+        """
+        Ölçeýjiniň we söz keşiniň häzirki statistikasy
+        """
+        result = self.profiler.stats() if self.profiler is not None else {'timers': {}, 'counters': {}}
+        result['enabled'] = self.profiler is not None
+        result['cache'] = self.cache_info()
+        return result
+
+    def _emit(self, verbose: bool, event: str, **fields):
+        """
+        train wakasyny callback-a (ýa-da verbose bolsa konsola) iberýär
+        """
+        callback = self.profiler.callback if self.profiler is not None else None
+        if callback is None:
+            if not verbose:
+                return
+            callback = _print_event
+        fields['event'] = event
+        callback(fields)
+
+    def clear_cache(self):
+        """
+        Söz keşlerini we hasaplaýjylary arassalaýar
+        """
+        self._word_cache.clear()
+        self._split_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
     def is_proper_noun(self, word: str) -> Tuple[bool, str]:
         """
         Söziň adaty at (proper noun) bardygyny barlaýar
         Gaýtaryş: (haýsy_at_bolsa, at_görnüşi)
         """
-        word_lower = word.lower()
-        
-        # Adam atlary
-        if word_lower in self.male_names or word_lower in self.female_names:
-            return True, 'name'
-        
-        # Şäher atlary
-        if word_lower in self.cities:
-            return True, 'city'
-        
-        # Ýurt atlary
-        if word_lower in self.countries:
-            return True, 'country'
-        
-        # Möhüm sözler
-        if word_lower in self.important_words:
-            return True, 'important'
-        
+        proper_type = self._gazetteer.get(word.lower())
+        if proper_type is not None:
+            return True, proper_type
         return False, None
     
     def normalize_text(self, text: str) -> str:
+        """
+        Teksti normallaşdyrýar: NFKC, ýalňyş harplary düzetmek,
+        artykmaç boşluklary aýyrmak we kiçi harplara geçirmek
+        """
         text = unicodedata.normalize("NFKC", text)
         # 2. Türkmen dilindäki ýygy duş gelýän ýalňyşlary düzetmek
-        replacements = {
-            "ÿ": "ý", "¥": "ý",  # Ýalňyş kodlanan ý-ler
-            "ə": "ä",            # Azeri/Tatar klawiaturasyndan galanlar
-            "ş": "ş", "s": "ş",  # Käwagt ş ýerine s ýazylýar (muňa seresap bolmaly)
-            "“": '"', "”": '"', "’": "'", "‘": "'", # Dürli dyrnaklar
-            "\u00ad": "",        # Soft hyphen (görünmeýän kese çyzyk)
-            "&nbsp;": " "        # HTML boşluk
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-            
-        # 3. Artykmaç boşluklary aýyrmak
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip().lower()
+        text = text.translate(NORMALIZE_TABLE)
+        # 3. Artykmaç boşluklary aýyrmak (re.sub(r'\s+', ' ') + strip() bilen deň)
+        return ' '.join(text.split()).lower()
 
     def aggressive_suffix_split(self, word: str) -> str:
         """
@@ -297,55 +1060,211 @@ class TurkmenBPETokenizer:
         Meselem: "mekdepde" -> "mekdep de"
         """
         # Gysga sözlere degmeýäris (ýalňyş bölmezlik üçin)
-        if len(word) < 4:
+        word_len = len(word)
+        if word_len < 4:
             return word
             
-        # Goşulmalary uzynlygyna görä tertipleýäris (uzynlar öňde)
-        sorted_suffixes = sorted(self.common_suffixes, key=len, reverse=True)
-        
-        for suffix in sorted_suffixes:
-            if word.endswith(suffix):
-                # Kök söz gaty gysga bolmaly däl (meselem: 'ada' -> 'a da' bolmazlygy üçin)
-                stem = word[:-len(suffix)]
-                if len(stem) >= 2:
-                    return f"{stem} {suffix}"
+        # Goşulma uzynlyklaryny uzyndan gysga barlaýarys (iň uzyn goşulma öňde)
+        suffix_set = self._suffix_set
+        for length in self._suffix_lengths:
+            # Kök söz gaty gysga bolmaly däl (meselem: 'ada' -> 'a da' bolmazlygy üçin)
+            stem_len = word_len - length
+            if stem_len < 2:
+                continue
+            suffix = word[stem_len:]
+            if suffix in suffix_set:
+                return f"{word[:stem_len]} {suffix}"
         return word
 
     # 2-NJI ÄDIM: pre_tokenize funksiýasyny täzeläň (köne koduny öçürip, şuny goýuň)
     def pre_tokenize(self, text: str) -> List[Tuple[str, str]]:
         """
         Teksti sözlere we nyşanlara bölýär, at görnüşini hem belleýär.
-        Goşulmalary hem aýratynlaýar.
+        Goşulmalary hem aýratynlaýar. Köp sözli atlar (meselem: "amerikanyň birleşen
+        ştatlary") bir görnüşli token bolup gelýär - sözleriň arasynda bir boşluk bilen.
         """
+        if self.normalize:
+            text = self.normalize_text(text)
         text_lower = text.lower()
-        
-        # Regex pattern
-        pattern = r"[a-zäňöşüýžа-я]+|[0-9]+|[^\w\s]+"
-        raw_tokens = re.findall(pattern, text_lower)
-        
+
+        raw_tokens = TOKEN_RE.findall(text_lower)
+
         typed_tokens = []
-        for token in raw_tokens:
-            # Ilki bilen adaty atdygyny barla
-            is_proper, proper_type = self.is_proper_noun(token)
-            
-            if is_proper:
-                typed_tokens.append((token, proper_type))
+        cache = self._split_cache
+        try:
+            for token in raw_tokens:
+                pieces = cache.get(token)
+                typed_tokens.extend(pieces if pieces is not None else self._split_entry(token))
+        except _EntityStartFound as found:
+            # Köp sözli atyň birinji sözi: ondan öňki tokenlerde bu söz ýok,
+            # şonuň üçin ilkinji duşýan ýerinden trie bilen dowam edilýär
+            self._pre_tokenize_entities(raw_tokens, raw_tokens.index(found.args[0]), typed_tokens)
+
+        return typed_tokens
+
+    def _pre_tokenize_entities(self, raw_tokens: List[str], index: int,
+                               typed_tokens: List[Tuple[str, str]]):
+        """
+        pre_tokenize-yň dowamy index-den başlap: keşde _EntityStart bellikli tokenden
+        trie boýunça iň uzyn at gözlenýär, tapylmasa tokeniň adaty bölekleri alynýar
+        """
+        cache_get = self._split_cache.get
+        extend = typed_tokens.extend
+        trie = self._entity_trie
+        entity_start = _EntityStart
+        count = len(raw_tokens)
+        skip = index
+        for index in range(index, count):
+            if index < skip:
+                continue
+            token = raw_tokens[index]
+            entry = cache_get(token)
+            if entry is None:
+                entry = self._split_entry(token)
+            if entry.__class__ is not entity_start:
+                extend(entry)
+                continue
+            # _match_entity ýaly iň uzyn at (bu ýerde içine goýlan - ýygy çagyrylýar)
+            node = trie[token]
+            match = None
+            end = index + 1
+            while end < count:
+                node = node.get(raw_tokens[end])
+                if node is None:
+                    break
+                end += 1
+                entity = node.get('')
+                if entity is not None:
+                    match = entity
+                    skip = end
+            if match is not None:
+                typed_tokens.append(match)
             else:
-                # Eger adaty at däl bolsa, goşulmany barlap gör
-                # Meselem: "mekdepde" -> "mekdep" "de"
-                split_version = self.aggressive_suffix_split(token)
-                
-                if split_version != token:
-                    # Eger söz bölünen bolsa (mekdep de)
-                    parts = split_version.split()
-                    for part in parts:
-                        typed_tokens.append((part, 'word'))
-                else:
-                    # Bölünmedik bolsa
-                    typed_tokens.append((token, 'word'))
-        
+                extend(entry.pieces)
+
+    def _pre_tokenize_profiled(self, text: str) -> List[Tuple[str, str]]:
+        """
+        pre_tokenize bilen birmeňzeş, ýöne ädimleriň wagty (normalize, regex,
+        is_proper_noun, suffix_split) we hasaplaýjylary ýazylýar.
+        enable_profiling ony nusganyň pre_tokenize-ynyň ýerine goýýar.
+        """
+        profiler = self.profiler
+        clock = time.perf_counter
+        started = clock()
+        if self.normalize:
+            text = self.normalize_text(text)
+            profiler.add_time('normalize', clock() - started)
+            started = clock()
+        raw_tokens = TOKEN_RE.findall(text.lower())
+        profiler.add_time('regex', clock() - started)
+
+        typed_tokens = []
+        started = clock()
+        entities = self._find_entities(raw_tokens)
+        profiler.add_time('is_proper_noun', clock() - started)
+        skip = 0
+        for index, token in enumerate(raw_tokens):
+            if index < skip:
+                continue
+            match = entities.get(index)
+            if match is not None:
+                skip, entity = match
+                typed_tokens.append(entity)
+                profiler.count('entities')
+                continue
+            typed_tokens.extend(self._split_token_profiled(token, profiler))
+
         return typed_tokens
 
+    def _find_entities(self, tokens: List[str]) -> Dict[int, Tuple[int, Tuple[str, str]]]:
+        """
+        Köp sözli atlary token akymynda çepden saga bir geçişde tapýar: her orunda
+        trie boýunça iň uzyn at alynýar we onuň soňundan dowam edilýär.
+        Gaýtaryş: başlangyç indeks -> (atdan soňky indeks, (at, görnüş))
+        """
+        trie = self._entity_trie
+        entities = {}
+        if not trie or trie.keys().isdisjoint(tokens):
+            return entities
+
+        index, count = 0, len(tokens)
+        while index < count:
+            match = self._match_entity(tokens, index) if tokens[index] in trie else None
+            if match is not None:
+                entities[index] = match
+                index = match[0]
+            else:
+                index += 1
+        return entities
+
+    def _match_entity(self, tokens: List[str], index: int) -> Optional[Tuple[int, Tuple[str, str]]]:
+        """
+        index-den başlaýan iň uzyn köp sözli at: (atdan soňky indeks, (at, görnüş)) ýa-da None
+        """
+        node = self._entity_trie.get(tokens[index])
+        match = None
+        end = index + 1
+        count = len(tokens)
+        while node is not None:
+            entity = node.get('')
+            if entity is not None:
+                match = (end, entity)
+            if end == count:
+                break
+            node = node.get(tokens[end])
+            end += 1
+        return match
+
+    def _split_token(self, token: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Bir regex tokenini (kiçi harplarda) görnüşli böleklere bölýär (keş bilen)
+        """
+        entry = self._split_cache.get(token)
+        if entry is None:
+            entry = self._split_entry(token)
+        return entry.pieces if entry.__class__ is _EntityStart else entry
+
+    def _split_entry(self, token: str):
+        """
+        Tokeniň _split_cache bahasy: görnüşli bölekler ýa-da token köp sözli atyň
+        birinji sözi bolsa _EntityStart bellik (keş doly bolsa-da gaýtarylýar)
+        """
+        entry = self._split_cache.get(token)
+        if entry is not None:
+            return entry
+
+        # Ilki bilen adaty atdygyny barla
+        proper_type = self._gazetteer.get(token)
+        if proper_type is not None:
+            pieces = ((token, proper_type),)
+        else:
+            # Eger adaty at däl bolsa, goşulmany barlap gör
+            # Meselem: "mekdepde" -> "mekdep" "de" (bölünmedik bolsa söz özi)
+            pieces = tuple((part, 'word') for part in self.aggressive_suffix_split(token).split())
+
+        entry = _EntityStart(token, pieces) if token in self._entity_trie else pieces
+        if len(self._split_cache) < self.split_cache_size:
+            self._split_cache[token] = entry
+        return entry
+
+    def _split_token_profiled(self, token: str, profiler: Profiler) -> Tuple[Tuple[str, str], ...]:
+        """
+        _split_token, ýöne adaty at barlagynyň we goşulma bölmegiň wagty aýratyn ýazylýar
+        """
+        clock = time.perf_counter
+        started = clock()
+        proper_type = self._gazetteer.get(token)
+        checked = clock()
+        profiler.add_time('is_proper_noun', checked - started)
+        if proper_type is not None:
+            profiler.count('proper_nouns')
+            return ((token, proper_type),)
+        pieces = self._split_token(token)
+        profiler.add_time('suffix_split', clock() - checked)
+        if len(pieces) > 1:
+            profiler.count('suffix_splits')
+        return pieces
+
     def get_word_frequencies(self, corpus: List[str]) -> Dict[str, int]:
         """
         Sözleriň ýygylyklaryny hasaplaýar
@@ -353,12 +1272,103 @@ class TurkmenBPETokenizer:
         word_freqs = Counter()
         
         for text in corpus:
-            tokens = self.pre_tokenize(text)
-            # Diňe söz bölekleri al, at görnüşini aýyr
-            words = [token for token, _ in tokens]
-            word_freqs.update(words)
+            word_freqs.update(self._word_tokens(text))
         
         return dict(word_freqs)
+
+    def _word_tokens(self, text: str) -> List[str]:
+        """
+        Öwreniş üçin sözler: pre_tokenize bölekleri at görnüşisiz. Köp sözli atlar
+        söz kitabyna tutuş goşulýar (add_proper_nouns_to_vocab), şonuň üçin bu ýerde
+        olaryň sözleri aýratyn sanalýar - birleşdirmelere boşluk girmeýär.
+        """
+        words = []
+        # Öwreniş ölçeýji açyk bolsa-da ölçenmeýän pre_tokenize-y ulanýar (train.* taýmerleri bar)
+        for token, _ in TurkmenBPETokenizer.pre_tokenize(self, text):
+            if ' ' in token:
+                words.extend(token.split(' '))
+            else:
+                words.append(token)
+        return words
+
+    def get_word_frequencies_parallel(self, corpus_path: str, num_workers: Optional[int] = None,
+                                      max_words_in_memory: Optional[int] = None,
+                                      spill_dir: Optional[str] = None) -> Dict[str, int]:
+        """
+        Sözleriň ýygylyklaryny faýlyň baýt aralyklary boýunça parallel hasaplaýar (map-reduce).
+        Netije get_word_frequencies bilen birmeňzeş, sözleriň tertibi hem (ilkinji duşýan ýeri).
+
+        max_words_in_memory: işçiniň Counter-inde şu sandan köp söz bolsa,
+        bölek netije spill_dir-däki faýla ýazylýar we Counter arassalanýar.
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+
+        file_size = os.path.getsize(corpus_path)
+        num_shards = max(1, num_workers * 4)
+        bounds = [file_size * i // num_shards for i in range(num_shards + 1)]
+
+        own_spill_dir = spill_dir is None and max_words_in_memory is not None
+        if own_spill_dir:
+            spill_dir = tempfile.mkdtemp(prefix="tmbpe_counts_")
+
+        tasks = [(corpus_path, bounds[i], bounds[i + 1], max_words_in_memory, spill_dir)
+                 for i in range(num_shards) if bounds[i] < bounds[i + 1]]
+
+        if num_workers <= 1:
+            shard_results = (self._count_byte_range(task) for task in tasks)
+        else:
+            pool = self._get_pool(num_workers)
+            shard_results = pool.imap(_worker_call, [(TurkmenBPETokenizer._count_byte_range, task)
+                                                     for task in tasks])
+
+        # Reduce: böleklerini faýl tertibinde birleşdirmek sözleriň tertibini saklaýar
+        word_freqs = Counter()
+        try:
+            for spill_paths, counts in shard_results:
+                for path in spill_paths:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        word_freqs.update(dict(json.load(f)))
+                    os.remove(path)
+                word_freqs.update(dict(counts))
+        finally:
+            if own_spill_dir:
+                shutil.rmtree(spill_dir, ignore_errors=True)
+
+        return dict(word_freqs)
+
+    def _count_byte_range(self, task: Tuple) -> Tuple[List[str], List[Tuple[str, int]]]:
+        """
+        Faýlyň [start, end) aralygynda başlaýan setirlerdäki sözleri sanaýar
+        """
+        corpus_path, start, end, max_words_in_memory, spill_dir = task
+        counts = Counter()
+        spill_paths = []
+
+        with open(corpus_path, 'rb') as f:
+            if start > 0:
+                # Ýarym setiri geçýäris - ol öňki bölege degişli
+                f.seek(start - 1)
+                if f.read(1) != b'\n':
+                    f.readline()
+
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                text = line.decode('utf-8').strip()
+                if not text:
+                    continue
+                counts.update(self._word_tokens(text))
+
+                if max_words_in_memory is not None and len(counts) >= max_words_in_memory:
+                    fd, path = tempfile.mkstemp(suffix='.json', dir=spill_dir)
+                    with os.fdopen(fd, 'w', encoding='utf-8') as out:
+                        json.dump(list(counts.items()), out, ensure_ascii=False)
+                    spill_paths.append(path)
+                    counts = Counter()
+
+        return spill_paths, list(counts.items())
     
     def get_character_vocab(self, word_freqs: Dict[str, int]) -> Set[str]:
         """
@@ -449,14 +1459,82 @@ class TurkmenBPETokenizer:
         
         return vocab
     
-    def train(self, corpus_path: str, verbose: bool = True):
+    def _count_words(self, corpus_path: str, num_workers: int = 1,
+                     max_words_in_memory: Optional[int] = None) -> Dict[str, int]:
+        """
+        Korpus faýlyndaky sözleriň ýygylyklaryny hasaplaýar
+        """
         def corpus_generator():
             with open(corpus_path, "r", encoding="utf-8") as f:
                 for line in f:
                     if line.strip():
                         yield line.strip()
+
+        started = time.perf_counter()
+        if num_workers == 1 and max_words_in_memory is None:
+            word_freqs = self.get_word_frequencies(corpus_generator())
+        else:
+            word_freqs = self.get_word_frequencies_parallel(
+                corpus_path, num_workers=num_workers, max_words_in_memory=max_words_in_memory)
+        if self.profiler is not None:
+            self.profiler.add_time('train.count_words', time.perf_counter() - started)
+            self.profiler.count('train.unique_words', len(word_freqs))
+        return word_freqs
+
+    def prune_word_frequencies(self, word_freqs: Dict[str, int], min_frequency: int = 1,
+                               max_unique_words: Optional[int] = None) -> Dict[str, int]:
         """
-        Korpusda BPE tokenizerini öwredýär
+        Seýrek sözleri (ýazuw ýalňyşlary, OCR galyndylary) aýyrýar: min_frequency-den
+        az duşýanlar we iň ýygy max_unique_words sözden daşgarylar.
+        Galan sözleriň tertibi (korpusda ilkinji duşýan ýeri) üýtgemeýär.
+        """
+        kept = word_freqs
+        if min_frequency > 1:
+            kept = {word: freq for word, freq in word_freqs.items() if freq >= min_frequency}
+        if max_unique_words is not None and len(kept) > max_unique_words:
+            # Deň ýygylykda korpusda öň duşýan söz saýlanýar
+            top = heapq.nlargest(max_unique_words, enumerate(kept.values()),
+                                 key=lambda item: (item[1], -item[0]))
+            keep = set(index for index, _ in top)
+            kept = {word: freq for index, (word, freq) in enumerate(kept.items()) if index in keep}
+        return dict(kept)
+
+    def _build_engine(self, splits: Optional[Dict[str, List[str]]] = None,
+                      backend: str = 'python') -> _MergeEngine:
+        """
+        self.word_freqs üçin birleşdiriji engine gurýar (jübütleri ilkinji gezek sanaýar).
+        backend: 'python' (_MergeEngine) ýa-da 'numpy' (_NumpyMergeEngine)
+        """
+        engines = {'python': _MergeEngine, 'numpy': _NumpyMergeEngine}
+        if backend not in engines:
+            raise ValueError(f"Nätanyş backend: {backend!r} ('python' ýa-da 'numpy')")
+        started = time.perf_counter()
+        engine = engines[backend](self.word_freqs, splits=splits)
+        if self.profiler is not None:
+            self.profiler.add_time('train.count_pairs', time.perf_counter() - started)
+        return engine
+
+    def train(self, corpus_path: str, verbose: bool = True, num_workers: int = 1,
+              max_words_in_memory: Optional[int] = None, checkpoint_path: Optional[str] = None,
+              checkpoint_every: int = 1000, min_frequency: int = 1,
+              max_unique_words: Optional[int] = None, min_pair_frequency: int = 1,
+              backend: str = 'python'):
+        """
+        Korpusda BPE tokenizerini öwredýär.
+        num_workers > 1 bolsa söz ýygylyklary parallel hasaplanýar
+        (get_word_frequencies_parallel), max_words_in_memory bilen diske ýazyp bilýär.
+        checkpoint_path berilse, her checkpoint_every birleşdirmeden soň öwreniş ýagdaýy
+        saklanýar we resume_training bilen dowam etdirip bolýar.
+
+        Öwreniş býujeti:
+            min_frequency      - şundan az duşýan sözler birleşdirmelere gatnaşmaýar
+            max_unique_words   - diňe iň ýygy şonça söz ulanylýar
+            min_pair_frequency - iň ýygy jübüt şundan seýrek bolsa öwreniş durýar
+                                 (söz kitaby vocab_size-dan kiçi bolup biler)
+        Harp toplumy hemişe ähli sözlerden gurulýar.
+
+        backend='numpy' bolsa jübütler NumPy massiwlerinde sanalýar we birleşdirilýär
+        (_NumpyMergeEngine, 'numpy' gerek); netije 'python' bilen birmeňzeş.
         """
         if verbose:
             print("🇹🇲 Türkmen BPE Tokenizer öwrenişi başlanýar...")
@@ -467,12 +1545,26 @@ class TurkmenBPETokenizer:
             print(f"✓ {len(self.special_tokens)} aýratyn token goşuldy")
         
         # 2. Sözleriň ýygylyklaryny hasapla
-        self.word_freqs = self.get_word_frequencies(corpus_generator())
+        word_freqs = self._count_words(corpus_path, num_workers, max_words_in_memory)
         if verbose:
-            print(f"✓ {len(self.word_freqs)} üýtgeşik söz tapyldy")
-        
-        # 3. Başlangyç harp toplumyny döret
-        chars = self.get_character_vocab(self.word_freqs)
+            print(f"✓ {len(word_freqs)} üýtgeşik söz tapyldy")
+
+        # Seýrek sözleri aýyr - galan sözleriň korpusdaky paýy habar berilýär
+        self.word_freqs = self.prune_word_frequencies(word_freqs, min_frequency, max_unique_words)
+        if len(self.word_freqs) < len(word_freqs):
+            total_mass = sum(word_freqs.values())
+            kept_mass = sum(self.word_freqs.values())
+            if self.profiler is not None:
+                self.profiler.count('train.kept_words', len(self.word_freqs))
+                self.profiler.count('train.kept_mass', kept_mass)
+                self.profiler.count('train.total_mass', total_mass)
+            if verbose:
+                print(f"✓ Seýrek sözler aýryldy: {len(self.word_freqs)}/{len(word_freqs)} söz galdy, "
+                      f"olar korpusdaky sözleriň {100.0 * kept_mass / max(total_mass, 1):.2f}%-ini örtýär")
+        
+        # 3. Başlangyç harp toplumyny döret (aýrylan sözleriň harplary hem)
+        chars = self.get_character_vocab(word_freqs)
+        del word_freqs
         vocab.extend(list(chars) + ['</w>'])
         if verbose:
             print(f"✓ Başlangyç harp toplumy: {len(chars)} simwol")
@@ -485,42 +1577,89 @@ class TurkmenBPETokenizer:
             print(f"  - Şäher atlary: {len(self.cities)}")
             print(f"  - Ýurt atlary: {len(self.countries)}")
         
-        # 5. Sözleri harplara böl
-        splits = {word: self.split_word_to_chars(word) 
-                 for word in self.word_freqs.keys()}
-        
-        # 6. BPE birleşdirmeleri
+        # 5-6. BPE birleşdirmeleri
         num_merges = self.vocab_size - len(vocab)
         
         if verbose:
             print(f"\n🔄 BPE birleşdirmeleri başlanýar ({num_merges} gezek)...")
         
-        for i in range(num_merges):
-            # Jübüt ýygylyklary
-            pair_freqs = self.get_pair_frequencies(splits, self.word_freqs)
-            
-            if not pair_freqs:
+        # Sözler engine içinde harp ID-lerine bölünýär (split_word_to_chars ýaly),
+        # jübüt ýygylyklary bir gezek hasaplanýar, soň artýmly täzelenýär
+        engine = self._build_engine(backend=backend)
+
+        # Söz kitaby: ID-ler sanaw tertibi boýunça (gaýtalanýan token soňky ID-ni alýar)
+        vocab = {token: idx for idx, token in enumerate(vocab)}
+        next_id = len(vocab) and max(vocab.values()) + 1
+
+        self._run_merges(engine, vocab, next_id, 0, num_merges, verbose,
+                         checkpoint_path, checkpoint_every, min_pair_frequency)
+    
+    def _run_merges(self, engine: _MergeEngine, vocab: Dict[str, int], next_id: int,
+                    start: int, num_merges: int, verbose: bool,
+                    checkpoint_path: Optional[str], checkpoint_every: int,
+                    min_pair_frequency: int = 1):
+        """
+        BPE birleşdirmeleriniň esasy aýlawy (start ädiminden num_merges çenli),
+        soňra söz kitabyny jemleýär
+        """
+        profiler = self.profiler
+        clock = time.perf_counter
+        loop_started = clock()
+        done = 0
+
+        for i in range(start, num_merges):
+            # Iň ýygy jübüt
+            if profiler is None:
+                best_pair = engine.best_pair()
+            else:
+                started = clock()
+                best_pair = engine.best_pair()
+                profiler.add_time('train.best_pair', clock() - started)
+
+            if best_pair is None:
                 if verbose:
                     print(f"⚠ {i} birleşdirmeden soň täze jübüt tapylmady")
                 break
-            
-            # Iň ýygy jübüt
-            best_pair = max(pair_freqs, key=pair_freqs.get)
-            
+            if min_pair_frequency > 1:
+                frequency = engine.pair_frequency(best_pair)
+                if frequency < min_pair_frequency:
+                    if verbose:
+                        print(f"⚠ {i} birleşdirmeden soň iň ýygy jübüt {frequency} gezek duşýar "
+                              f"(min_pair_frequency={min_pair_frequency}) - öwreniş duruzyldy")
+                    break
+
             # Birleşdir
-            splits = self.merge_pair(best_pair, splits)
+            if profiler is None:
+                engine.merge(best_pair)
+            else:
+                started = clock()
+                engine.merge(best_pair)
+                profiler.add_time('train.merge', clock() - started)
+                profiler.count('train.merges')
             self.merges.append(best_pair)
+            done += 1
             
             # Täze tokeni goş
             new_token = best_pair[0] + best_pair[1]
-            vocab.append(new_token)
+            vocab[new_token] = next_id
+            next_id += 1
             
-            if verbose and (i + 1) % 500 == 0:
-                print(f"  {i + 1}/{num_merges} birleşdirme tamamlandy - "
-                      f"Iň soňky: {best_pair[0]} + {best_pair[1]} = {new_token}")
+            if (i + 1) % 500 == 0:
+                rate = done / max(clock() - loop_started, 1e-9)
+                self._emit(verbose, 'merge_progress', step=i + 1, total=num_merges,
+                           merges_per_sec=rate, eta_sec=(num_merges - i - 1) / rate,
+                           pair=best_pair, token=new_token)
+
+            if checkpoint_path and (i + 1) % checkpoint_every == 0 and i + 1 < num_merges:
+                self._save_checkpoint(checkpoint_path, engine, vocab, next_id, i + 1, num_merges,
+                                      min_pair_frequency)
+                self._emit(verbose, 'checkpoint', step=i + 1, path=checkpoint_path)
+
+        elapsed = clock() - loop_started
+        self._emit(False, 'train_done', merges=done, seconds=elapsed,
+                   merges_per_sec=done / max(elapsed, 1e-9))
         
-        # Söz kitabyny döret
-        self.vocab = {token: idx for idx, token in enumerate(vocab)}
+        self.vocab = vocab
         
         # Aýratyn tokenler ID-lerini täzele
         for token, idx in self.special_tokens.items():
@@ -532,11 +1671,106 @@ class TurkmenBPETokenizer:
                 for t in list(self.vocab.keys()):
                     if self.vocab[t] == idx and t != token:
                         self.vocab[t] = old_idx
+
+        self._refresh_tables()
         
         if verbose:
             print(f"\n✅ Öwreniş tamamlandy! Jemi {len(self.vocab)} token")
             self._print_statistics()
-    
+
+    def _save_checkpoint(self, checkpoint_path: str, engine: _MergeEngine, vocab: Dict[str, int],
+                         next_id: int, step: int, num_merges: int, min_pair_frequency: int = 1):
+        """
+        Öwreniş ýagdaýyny (söz ýygylyklary, häzirki bölünişler, birleşdirmeler,
+        söz kitaby) gzip JSON görnüşinde atomik ýazýar
+        """
+        state = self._state_dict()
+        del state['vocab']
+        checkpoint = {
+            'format': CHECKPOINT_FORMAT,
+            'state': state,
+            'word_freqs': self.word_freqs,
+            # Sözlerde boşluk ýok, şonuň üçin bölünişler boşluk bilen birleşdirilýär
+            'splits': [' '.join(split) for split in engine.token_splits()],
+            'vocab': vocab,
+            'next_id': next_id,
+            'step': step,
+            'num_merges': num_merges,
+            'min_pair_frequency': min_pair_frequency,
+        }
+
+        directory = os.path.dirname(os.path.abspath(checkpoint_path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.ckpt-', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=5) as f:
+                f.write(json.dumps(checkpoint, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_path, checkpoint_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def resume_training(self, checkpoint_path: str, vocab_size: Optional[int] = None,
+                        verbose: bool = True, checkpoint_every: int = 1000):
+        """
+        train(..., checkpoint_path=...) bilen saklanan checkpointden öwrenişi dowam etdirýär.
+        Netije öwrenişiň arasy kesilmedik ýagdaýyndaky bilen birmeňzeş.
+        vocab_size has uly berilse, öwreniş şol ölçege çenli dowam edýär.
+        """
+        with gzip.open(checkpoint_path, 'rb') as f:
+            checkpoint = json.loads(f.read().decode('utf-8'))
+        if checkpoint.get('format') != CHECKPOINT_FORMAT:
+            raise ValueError(f"'{checkpoint_path}' öwreniş checkpointi däl")
+
+        self._load_state_dict(dict(checkpoint['state'], vocab={}))
+        self.word_freqs = checkpoint['word_freqs']
+        splits = {word: split.split(' ')
+                  for word, split in zip(self.word_freqs, checkpoint['splits'])}
+
+        num_merges = checkpoint['num_merges']
+        if vocab_size is not None:
+            num_merges += vocab_size - self.vocab_size
+            self.vocab_size = vocab_size
+
+        step = checkpoint['step']
+        if verbose:
+            print(f"🔁 Öwreniş checkpointden dowam edýär: {step}/{num_merges} birleşdirme")
+
+        engine = self._build_engine(splits)
+        self._run_merges(engine, checkpoint['vocab'], checkpoint['next_id'], step, num_merges,
+                         verbose, checkpoint_path, checkpoint_every,
+                         checkpoint.get('min_pair_frequency', 1))
+
+    def continue_training(self, corpus_path: str, vocab_size: int, verbose: bool = True,
+                          num_workers: int = 1, max_words_in_memory: Optional[int] = None,
+                          checkpoint_path: Optional[str] = None, checkpoint_every: int = 1000):
+        """
+        Öwredilen (ýa-da ýüklenen) modeli täzeden başlamazdan has uly vocab_size çenli öwredýär.
+        Bar bolan birleşdirmeler we ID-ler üýtgemeýär, täze tokenler iň uly ID-den soň goşulýar.
+        Şol bir korpusda netije vocab_size bilen başdan öwrenişdäki birleşdirmeler bilen gabat gelýär.
+        """
+        if verbose:
+            print(f"🔁 Öwreniş {len(self.vocab)} tokenden {vocab_size} çenli dowam edýär...")
+
+        self.word_freqs = self._count_words(corpus_path, num_workers, max_words_in_memory)
+        vocab = dict(self.vocab)
+        next_id = len(vocab) and max(vocab.values()) + 1
+
+        # Korpusda täze harplar bar bolsa, olary hem goş
+        for char in sorted(self.get_character_vocab(self.word_freqs)):
+            if char not in vocab:
+                vocab[char] = next_id
+                next_id += 1
+
+        # Bar bolan birleşdirmeleri ulan - engine şol ýagdaýdan dowam edýär
+        splits = {word: self.apply_merges(word) for word in self.word_freqs}
+        num_merges = vocab_size - next_id
+        self.vocab_size = vocab_size
+
+        engine = self._build_engine(splits)
+        self._run_merges(engine, vocab, next_id, 0, max(num_merges, 0), verbose,
+                         checkpoint_path, checkpoint_every)
+
     def _print_statistics(self):
         """
         Tokenizer statistikasyny görkezýär
@@ -571,74 +1805,583 @@ class TurkmenBPETokenizer:
         
         print(f"  - Türkmen goşulmalaryny öz içine alýan tokenler: {suffix_count}")
     
+    def apply_merges(self, word: str) -> List[str]:
+        """
+        Bir söze BPE birleşdirmelerini ulanýar.
+        Her ädimde iň kiçi rankly goňşy jübüt birleşdirilýär (GPT-2 ýaly), ýöne
+        diňe öň ulanylan rankdan uly ranklar seredilýär - netije birleşdirmeleri
+        tertip boýunça yzygiderli ulanmak bilen birmeňzeş bolýar.
+        """
+        word_tokens = self.split_word_to_chars(word)
+        ranks = self.merge_ranks
+        last_rank = -1
+
+        while len(word_tokens) > 1:
+            best_rank = None
+            for i in range(len(word_tokens) - 1):
+                rank = ranks.get((word_tokens[i], word_tokens[i + 1]))
+                if rank is not None and rank > last_rank and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+            if best_rank is None:
+                break
+
+            first, second = self.merges[best_rank]
+            new_tokens = []
+            i = 0
+            while i < len(word_tokens):
+                if i < len(word_tokens) - 1 and word_tokens[i] == first and word_tokens[i + 1] == second:
+                    new_tokens.append(first + second)
+                    i += 2
+                else:
+                    new_tokens.append(word_tokens[i])
+                    i += 1
+            word_tokens = new_tokens
+            last_rank = best_rank
+
+        return word_tokens
+
     def tokenize(self, text: str) -> List[str]:
         """
         Teksti tokenlere bölýär
         """
         tokens = []
-        typed_words = self.pre_tokenize(text)
-        
-        for word, word_type in typed_words:
-            # Eger adaty at bolsa we söz kitabynda bar bolsa, tutuş söz hökmünde goş
-            full_word_token = word + '</w>'
-            if word_type != 'word' and full_word_token in self.vocab:
-                tokens.append(full_word_token)
-                continue
-            
-            # Harplardan başla
-            word_tokens = self.split_word_to_chars(word)
-            
-            # Birleşdirmeleri ulan
-            for merge in self.merges:
-                i = 0
-                while i < len(word_tokens) - 1:
-                    if (word_tokens[i], word_tokens[i + 1]) == merge:
-                        word_tokens[i] = word_tokens[i] + word_tokens[i + 1]
-                        word_tokens.pop(i + 1)
-                    else:
-                        i += 1
-            
-            tokens.extend(word_tokens)
-        
+        for word, word_type in self.pre_tokenize(text):
+            tokens.extend(self._encode_word(word, word_type)[0])
         return tokens
+
+    def _tokenize_profiled(self, text: str) -> List[str]:
+        return self._encode_text_profiled(text)[0]
+
+    def _encode_profiled(self, text: str) -> List[int]:
+        return self._encode_text_profiled(text)[1]
+
+    def _encode_text_profiled(self, text: str) -> Tuple[List[str], List[int]]:
+        """
+        Profiler açyk wagty tokenize/encode: şol bir _encode_word,
+        üstesine birleşdirmeleriň wagty (merges) we söz/token hasaplaýjylary ýazylýar.
+        """
+        profiler = self.profiler
+        typed_tokens = self._pre_tokenize_profiled(text)
+        started = time.perf_counter()
+        tokens, ids = [], []
+        merges_applied = 0
+        for word, word_type in typed_tokens:
+            misses = self.cache_misses
+            word_tokens, word_ids = self._encode_word(word, word_type)
+            if self.cache_misses != misses and not (word_type != 'word' and word in self._gazetteer_ids):
+                merges_applied += len(word) - word.count(' ') - len(word_tokens)
+            tokens.extend(word_tokens)
+            ids.extend(word_ids)
+        profiler.add_time('merges', time.perf_counter() - started)
+        profiler.count('merges_applied', merges_applied)
+        profiler.count('texts')
+        profiler.count('words', len(typed_tokens))
+        profiler.count('tokens', len(ids))
+        return tokens, ids
+
+    def _encode_word(self, word: str, word_type: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        """
+        Bir sözüň tokenlerini we ID-lerini gaýtarýar (LRU keş bilen)
+        """
+        key = (word, word_type)
+        cache = self._word_cache
+        cached = cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            cache.move_to_end(key)
+            return cached
+
+        self.cache_misses += 1
+        # Eger adaty at bolsa we söz kitabynda bar bolsa, tutuş söz hökmünde goş
+        token_id = self._gazetteer_ids.get(word) if word_type != 'word' else None
+        if token_id is not None:
+            result = ((word + '</w>',), (token_id,))
+        else:
+            if ' ' in word:
+                # Söz kitabynda ýok köp sözli at: her sözi aýratyn (goşulmasyz) birleşdirilýär
+                tokens = tuple(token for part in word.split(' ') for token in self.apply_merges(part))
+            else:
+                tokens = tuple(self.apply_merges(word))
+            unk_id = self.special_tokens['<unk>']
+            result = (tokens, tuple(self.vocab.get(token, unk_id) for token in tokens))
+
+        if self.cache_size > 0:
+            cache[key] = result
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+                self.cache_evictions += 1
+        return result
     
     def encode(self, text: str) -> List[int]:
         """
         Teksti token ID-lerine öwürýär
         """
-        tokens = self.tokenize(text)
-        return [self.vocab.get(token, self.special_tokens['<unk>']) for token in tokens]
+        ids = []
+        for word, word_type in self.pre_tokenize(text):
+            ids.extend(self._encode_word(word, word_type)[1])
+        return ids
     
+    def encode_with_offsets(self, text: str) -> Dict[str, List]:
+        """
+        Teksti ID-lere öwürýär we her tokeniň asyl tekstdäki ornuny gaýtarýar.
+        Gaýtaryş:
+            'ids'      - token ID-leri (encode bilen birmeňzeş)
+            'offsets'  - her token üçin asyl (normallaşdyrylmadyk) tekstdäki (başy, soňy)
+            'word_ids' - her tokeniň degişli bolan regex sözüniň indeksi
+        """
+        if self.normalize:
+            raise ValueError("encode_with_offsets normalize=True bilen goldanylmaýar: "
+                             "normallaşdyrma asyl tekstdäki orunlary üýtgedýär")
+        text_lower = text.lower()
+        # Käbir harplar kiçi harpa geçende uzalýar (meselem: 'İ' -> 'i̇'),
+        # şeýle ýagdaýda kiçi harply tekstdäki orny asyl orna geçirýäris
+        index_map = None
+        if len(text_lower) != len(text):
+            index_map = []
+            for i, char in enumerate(text):
+                index_map.extend([i] * len(char.lower()))
+
+        def add_offset(start: int, end: int):
+            if index_map is None:
+                offsets.append((start, end))
+            else:
+                offsets.append((index_map[start], index_map[end - 1] + 1))
+
+        matches = list(TOKEN_RE.finditer(text_lower))
+        entities = self._find_entities([match.group() for match in matches])
+        ids, offsets, word_ids = [], [], []
+        skip = 0
+        for word_index, match in enumerate(matches):
+            if word_index < skip:
+                continue
+            entity = entities.get(word_index)
+            if entity is None:
+                words = [(word_index, self._split_token(match.group()))]
+            else:
+                skip, (word, word_type) = entity
+                entity_tokens, entity_ids = self._encode_word(word, word_type)
+                ids.extend(entity_ids)
+                if len(entity_tokens) == 1:
+                    # Köp sözli at bir token: ilkinji sözüň başyndan soňky sözüň soňuna çenli
+                    add_offset(match.start(), matches[skip - 1].end())
+                    word_ids.append(word_index)
+                    continue
+                # Söz kitabynda ýok at: _encode_word her sözi aýratyn birleşdirýär,
+                # her sözüň soňky tokeninde '</w>' bar - şol ýerde indiki söze geçilýär
+                index = word_index
+                token_start = match.start()
+                for token in entity_tokens:
+                    token_end = token_start + len(token)
+                    if token.endswith('</w>'):
+                        token_end -= 4
+                    add_offset(token_start, token_end)
+                    word_ids.append(index)
+                    token_start = token_end
+                    if token.endswith('</w>') and index + 1 < skip:
+                        index += 1
+                        token_start = matches[index].start()
+                continue
+
+            for index, pieces in words:
+                piece_start = matches[index].start()
+                for piece, piece_type in pieces:
+                    piece_tokens, piece_ids = self._encode_word(piece, piece_type)
+                    ids.extend(piece_ids)
+                    token_start = piece_start
+                    last = len(piece_tokens) - 1
+                    for i, token in enumerate(piece_tokens):
+                        # Diňe soňky tokende '</w>' bar
+                        token_end = token_start + len(token) - (4 if i == last else 0)
+                        add_offset(token_start, token_end)
+                        word_ids.append(index)
+                        token_start = token_end
+                    piece_start += len(piece)
+
+        return {'ids': ids, 'offsets': offsets, 'word_ids': word_ids}
+
     def decode(self, token_ids: List[int]) -> str:
         """
         Token ID-lerini tekste öwürýär
         """
-        # ID-den token-e geçiş
-        id_to_token = {idx: token for token, idx in self.vocab.items()}
-        tokens = [id_to_token.get(id, '<unk>') for id in token_ids]
-        
-        # Aýratyn tokenleri aýyr
-        tokens = [t for t in tokens if t not in self.special_tokens]
+        # ID-den token-e geçiş (aýratyn we nätanyş tokenler '' bolup aýrylýar)
+        table = self._decode_table
+        size = len(table)
+        tokens = [table[idx] if 0 <= idx < size else '' for idx in token_ids]
         
         # Tokenleri birleşdir we </w> aýyr
         text = ''.join(tokens).replace('</w>', ' ')
         return text.strip()
-    
+
+    def decode_stream(self) -> 'DecodeStream':
+        """
+        ID-leri birme-bir kabul edýän artýmly dekoder döredýär (akymly generasiýa üçin)
+        """
+        return DecodeStream(self)
+
+    def document_session(self, text: str = '') -> 'DocumentSession':
+        """
+        Redaktirlenýän resminama üçin artýmly encode sessiýasyny döredýär
+        (redaktor integrasiýasy üçin: her düwme basylanda tutuş tekst kodlanmaýar)
+        """
+        return DocumentSession(self, text)
+
+    def _get_pool(self, num_workers: int):
+        """
+        Işçi prosesleri gaýtarýar. Tokenizer ýagdaýy her işçä diňe bir gezek
+        (initializer arkaly) iberilýär, soňky çagyryşlarda pool gaýtadan ulanylýar.
+        """
+        if self._pool is None or self._pool_workers != num_workers:
+            self.close_pool()
+            self._pool = multiprocessing.Pool(
+                num_workers, initializer=_init_worker, initargs=(self._state_dict(), self._split_cache))
+            self._pool_workers = num_workers
+        return self._pool
+
+    def close_pool(self):
+        """
+        encode_batch/decode_batch üçin açylan işçi prosesleri ýapýar
+        """
+        if getattr(self, '_pool', None) is not None:
+            self._pool.terminate()
+            self._pool.join()
+        self._pool = None
+        self._pool_workers = 0
+
+    def _run_batch(self, func, items: List, num_workers: Optional[int], chunk_size: int) -> List:
+        """
+        Elementleri bölekläp işçilere paýlaýar we netijeleri giriş tertibinde gaýtarýar
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        if num_workers <= 1 or len(chunks) <= 1:
+            return func(self, items)
+
+        results = []
+        for chunk_result in self._get_pool(num_workers).imap(_worker_call, [(func, c) for c in chunks]):
+            results.extend(chunk_result)
+        return results
+
+    def _encode_many(self, texts: List[str]) -> List[List[int]]:
+        return [self.encode(text) for text in texts]
+
+    def _decode_many(self, list_of_ids: List[List[int]]) -> List[str]:
+        return [self.decode(token_ids) for token_ids in list_of_ids]
+
+    # Setiriň başyna we soňuna goşulýan aýratyn tokenler
+    SPECIAL_TEMPLATES = {
+        'bos_eos': ('<bos>', '<eos>'),
+        'cls_sep': ('<cls>', '<sep>'),
+    }
+
+    def encode_batch(self, texts: List[str], num_workers: Optional[int] = None,
+                     chunk_size: int = 256, return_tensors: Optional[str] = None,
+                     max_length: Optional[int] = None, padding=False, truncation: bool = False,
+                     add_special_tokens: Optional[str] = None):
+        """
+        Köp teksti parallel token ID-lerine öwürýär.
+        num_workers=None bolsa ähli CPU ýadrolary ulanylýar, 1 bolsa şu prosesde işleýär.
+        Netijeler giriş tertibinde gaýtarylýar.
+
+        add_special_tokens: 'bos_eos' (<bos> ... <eos>) ýa-da 'cls_sep' (<cls> ... <sep>)
+        truncation: max_length-den uzyn setirler kesilýär (aýratyn tokenler saklanýar)
+        return_tensors="np" bolsa NumPy görnüşinde gaýtarýar:
+            padding=True/'longest' - iň uzyn setire çenli <pad> bilen doldurylýar
+            padding='max_length'   - max_length-e çenli doldurylýar
+            padding=False          - ykjam (packed) görnüş: ähli ID-ler bir massiwde
+        Doldurylan görnüş: {'input_ids': int32 (n, L), 'attention_mask': int32 (n, L)}
+        Ykjam görnüş:      {'input_ids': int32 (jemi,), 'offsets': int64 (n + 1,)}
+        """
+        if add_special_tokens is not None and add_special_tokens not in self.SPECIAL_TEMPLATES:
+            raise ValueError(f"Nätanyş add_special_tokens: {add_special_tokens!r}")
+        if truncation and max_length is None:
+            raise ValueError("truncation=True üçin max_length gerek")
+        if truncation and max_length < sum(map(len, self._special_template_ids(add_special_tokens))):
+            raise ValueError("max_length aýratyn tokenlerden gysga")
+
+        encoded = self._run_batch(TurkmenBPETokenizer._encode_many, list(texts), num_workers, chunk_size)
+
+        if return_tensors is None:
+            if padding:
+                raise ValueError("padding diňe return_tensors='np' bilen ulanylýar")
+            if add_special_tokens is not None or truncation:
+                prefix, suffix = self._special_template_ids(add_special_tokens)
+                limit = max_length - len(prefix) - len(suffix) if truncation else None
+                encoded = [prefix + ids[:limit] + suffix for ids in encoded]
+            return encoded
+        if return_tensors != 'np':
+            raise ValueError(f"Goldanylmaýan return_tensors: {return_tensors!r}")
+        return self._to_numpy(encoded, max_length, padding, truncation, add_special_tokens)
+
+    def _special_template_ids(self, add_special_tokens: Optional[str]) -> Tuple[List[int], List[int]]:
+        if add_special_tokens is None:
+            return [], []
+        start, end = self.SPECIAL_TEMPLATES[add_special_tokens]
+        return [self.special_tokens[start]], [self.special_tokens[end]]
+
+    def _to_numpy(self, encoded: List[List[int]], max_length: Optional[int], padding,
+                  truncation: bool, add_special_tokens: Optional[str]) -> Dict:
+        """
+        Kodlanan setirleri setir boýunça Python sanawlaryny döretmezden NumPy massiwlerine geçirýär
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("return_tensors='np' üçin 'numpy' kitaphanasy gerek "
+                              "('pip install numpy').")
+
+        if padding is True:
+            padding = 'longest'
+        if padding not in (False, 'longest', 'max_length'):
+            raise ValueError(f"Nätanyş padding: {padding!r}")
+        if padding == 'max_length' and max_length is None:
+            raise ValueError("padding='max_length' üçin max_length gerek")
+
+        num_rows = len(encoded)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=num_rows)
+        flat = np.fromiter(itertools.chain.from_iterable(encoded), dtype=np.int32,
+                           count=int(lengths.sum()))
+
+        prefix, suffix = self._special_template_ids(add_special_tokens)
+        num_special = len(prefix) + len(suffix)
+
+        # Setirdäki orun we setir belgisi her ID üçin
+        rows = np.repeat(np.arange(num_rows), lengths)
+        starts = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(lengths, out=starts[1:])
+        positions = np.arange(len(flat), dtype=np.int64) - starts[rows]
+
+        if truncation:
+            limit = max_length - num_special
+            keep = positions < limit
+            flat, rows, positions = flat[keep], rows[keep], positions[keep]
+            lengths = np.minimum(lengths, limit)
+
+        positions += len(prefix)
+        lengths = lengths + num_special
+
+        if padding is False:
+            offsets = np.zeros(num_rows + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            input_ids = np.empty(int(offsets[-1]), dtype=np.int32)
+            input_ids[offsets[:-1][rows] + positions] = flat
+            if prefix:
+                input_ids[offsets[:-1]] = prefix[0]
+            if suffix:
+                input_ids[offsets[1:] - 1] = suffix[0]
+            return {'input_ids': input_ids, 'offsets': offsets}
+
+        if padding == 'max_length':
+            width = max_length
+            if num_rows and lengths.max() > width:
+                raise ValueError("Setir max_length-den uzyn: truncation=True ulanyň")
+        else:
+            width = int(lengths.max()) if num_rows else 0
+
+        input_ids = np.full((num_rows, width), self.special_tokens['<pad>'], dtype=np.int32)
+        input_ids[rows, positions] = flat
+        row_index = np.arange(num_rows)
+        if prefix:
+            input_ids[row_index, 0] = prefix[0]
+        if suffix:
+            input_ids[row_index, lengths - 1] = suffix[0]
+        attention_mask = (np.arange(width)[None, :] < lengths[:, None]).astype(np.int32)
+        return {'input_ids': input_ids, 'attention_mask': attention_mask}
+
+    def decode_batch(self, list_of_ids: List[List[int]], num_workers: Optional[int] = None,
+                     chunk_size: int = 256) -> List[str]:
+        """
+        Köp ID sanawyny parallel tekste öwürýär (giriş tertibinde)
+        """
+        return self._run_batch(TurkmenBPETokenizer._decode_many, list(list_of_ids), num_workers, chunk_size)
+
+    def _fingerprint(self) -> int:
+        """
+        Tokenizasiýa täsir edýän ýagdaýyň (söz kitaby, birleşdirmeler, atlar) CRC32 barlagy
+        """
+        state = self._state_dict()
+        for key in ('male_names', 'female_names', 'cities', 'countries', 'important_words'):
+            state[key] = sorted(state[key])
+        return zlib.crc32(json.dumps(state, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+
+    def encode_file(self, input_path: str, output_path: str, num_workers: Optional[int] = None,
+                    chunk_size: int = 1024, dtype: Optional[str] = None,
+                    add_special_tokens: Optional[str] = None, max_in_flight: Optional[int] = None,
+                    resume: bool = True, verbose: bool = True) -> Dict:
+        """
+        Tekst faýlyny setirme-setir okap, bölekleri parallel kodlaýar we ID-leri
+        np.memmap bilen okalyp bilinýän ikilik faýllara ýazýar:
+            output_path         - ähli ID-ler yzly-yzyna (little-endian uint16/uint32)
+            output_path.idx     - setir başlangyçlary, uint64 (setir sany + 1)
+            output_path.json    - meta maglumatlar (dtype, setir/token sany, giriş ýagdaýy)
+        Her giriş setiri bir resminama (boş setirler hem), i-nji setiriň ID-leri
+        ids[offsets[i]:offsets[i + 1]].
+
+        Ýat girişiň ölçegine bagly däl: diňe max_in_flight bölek bir wagtda işlenýär.
+        dtype=None bolsa söz kitabyna görä saýlanýar (iň uly ID < 65536 bolsa uint16),
+        dowam edilende bolsa öňki faýlyň dtype-y ulanylýar.
+        resume=True bolsa ýarym ýazylan faýllar iň soňky doly setire çenli kesilýär
+        we işlemek şol ýerden dowam edýär. Giriş faýly (ýoly, ölçegi, mtime) ýa-da
+        sazlamalar üýtgän bolsa ValueError - onda resume=False ulanyň.
+        """
+        if add_special_tokens is not None and add_special_tokens not in self.SPECIAL_TEMPLATES:
+            raise ValueError(f"Nätanyş add_special_tokens: {add_special_tokens!r}")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+
+        index_path, meta_path = output_path + '.idx', output_path + '.json'
+        previous = None
+        if resume and all(os.path.exists(path) for path in (output_path, index_path, meta_path)):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+
+        typecodes = {'uint16': 'H', 'uint32': 'I'}
+        max_id = max(self.vocab.values(), default=0)
+        if dtype is None and previous is not None:
+            dtype = previous.get('dtype')
+        if dtype is None:
+            dtype = 'uint16' if max_id < 2 ** 16 else 'uint32'
+        if dtype not in typecodes:
+            raise ValueError(f"Goldanylmaýan dtype: {dtype!r} ('uint16' ýa-da 'uint32')")
+        if max_id >= 2 ** (8 * array(typecodes[dtype]).itemsize):
+            raise ValueError(f"Iň uly ID ({max_id}) {dtype} görnüşine sygmaýar")
+        typecode = typecodes[dtype]
+        itemsize = array(typecode).itemsize
+
+        input_stat = os.stat(input_path)
+        meta = {
+            'format': SHARD_FORMAT,
+            'dtype': dtype,
+            'byteorder': 'little',
+            'index_dtype': 'uint64',
+            'lines': 0,
+            'tokens': 0,
+            'input_path': os.path.abspath(input_path),
+            'input_size': input_stat.st_size,
+            'input_mtime_ns': input_stat.st_mtime_ns,
+            'input_bytes': 0,
+            'add_special_tokens': add_special_tokens,
+            'vocab_size': len(self.vocab),
+            'max_id': max_id,
+            'tokenizer_crc32': self._fingerprint(),
+            'complete': False,
+        }
+
+        lines_done, tokens_done = 0, 0
+        if previous is not None:
+            # Başga ýa-da üýtgedilen giriş faýlynda köne orundan dowam etmek faýly bozar
+            for key in ('format', 'dtype', 'add_special_tokens', 'tokenizer_crc32',
+                        'input_path', 'input_size', 'input_mtime_ns'):
+                if previous.get(key) != meta[key]:
+                    raise ValueError(f"'{output_path}' başga sazlamalar bilen ýazylypdyr ({key}: "
+                                     f"{previous.get(key)!r} != {meta[key]!r}); resume=False ulanyň")
+            # Diňe ID-leri doly ýazylan setirler saklanýar: indeksiň soňundan
+            # ID faýlynyň ölçeginden geçmeýän ilkinji başlangyja çenli yza gaýdylýar
+            written = os.path.getsize(output_path) // itemsize
+            with open(index_path, 'rb') as f:
+                count = os.path.getsize(index_path) // 8
+                while count:
+                    f.seek((count - 1) * 8)
+                    tokens_done = struct.unpack('<Q', f.read(8))[0]
+                    if tokens_done <= written:
+                        break
+                    count -= 1
+            if count:
+                lines_done = count - 1
+            else:
+                tokens_done = 0
+
+        meta['lines'], meta['tokens'] = lines_done, tokens_done
+        mode = 'r+b' if previous is not None else 'wb'
+        with open(output_path, mode) as shard, open(index_path, mode) as index, \
+                open(input_path, 'rb') as source:
+            shard.truncate(tokens_done * itemsize)
+            shard.seek(0, os.SEEK_END)
+            index.truncate((lines_done + 1) * 8)
+            index.seek(lines_done * 8)
+            index.write(struct.pack('<Q', tokens_done))
+
+            # Girişde dowam etmeli ýer: meta ýazylan ýerden, ýogsa başdan setirleri geçip
+            skip = lines_done
+            if previous is not None and previous['lines'] <= lines_done:
+                source.seek(previous['input_bytes'])
+                skip -= previous['lines']
+            for _ in range(skip):
+                source.readline()
+            meta['input_bytes'] = source.tell()
+            self._write_shard_meta(meta_path, meta)
+
+            prefix, suffix = self._special_template_ids(add_special_tokens)
+            pool = self._get_pool(num_workers) if num_workers > 1 else None
+            pending = deque()
+
+            def write_result(encoded: List[List[int]], input_bytes: int):
+                ids = array(typecode)
+                starts = array('Q')
+                for token_ids in encoded:
+                    ids.extend(prefix)
+                    ids.extend(token_ids)
+                    ids.extend(suffix)
+                    starts.append(meta['tokens'] + len(ids))
+                if sys.byteorder != 'little':
+                    ids.byteswap()
+                    starts.byteswap()
+                # Ilki ID-ler, soň indeks, iň soňunda meta - bökülen ýerden dowam etmek üçin
+                shard.write(ids.tobytes())
+                shard.flush()
+                index.write(starts.tobytes())
+                index.flush()
+                meta['lines'] += len(encoded)
+                meta['tokens'] += len(ids)
+                meta['input_bytes'] = input_bytes
+                self._write_shard_meta(meta_path, meta)
+
+            while True:
+                chunk = [line.decode('utf-8').rstrip('\r\n')
+                         for line in itertools.islice(source, chunk_size)]
+                if not chunk:
+                    break
+                if pool is None:
+                    write_result(self._encode_many(chunk), source.tell())
+                    continue
+                if len(pending) >= max_in_flight:
+                    result, input_bytes = pending.popleft()
+                    write_result(result.get(), input_bytes)
+                pending.append((pool.apply_async(_worker_call, ((TurkmenBPETokenizer._encode_many, chunk),)),
+                                source.tell()))
+            while pending:
+                result, input_bytes = pending.popleft()
+                write_result(result.get(), input_bytes)
+
+            meta['complete'] = True
+            self._write_shard_meta(meta_path, meta)
+
+        if verbose:
+            print(f"✓ {meta['lines']} setir, {meta['tokens']} token '{output_path}' faýlyna ýazyldy "
+                  f"({dtype}{f', {lines_done} setir öňden bardy' if lines_done else ''})")
+        return meta
+
+    @staticmethod
+    def _write_shard_meta(meta_path: str, meta: Dict):
+        directory = os.path.dirname(os.path.abspath(meta_path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.shard-', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, meta_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     def save(self, filepath: str):
         """
         Tokenizerini faýla saklaýar
         """
-        data = {
-            'vocab': self.vocab,
-            'merges': self.merges,
-            'vocab_size': self.vocab_size,
-            'special_tokens': self.special_tokens,
-            'male_names': list(self.male_names),
-            'female_names': list(self.female_names),
-            'cities': list(self.cities),
-            'countries': list(self.countries),
-            'important_words': list(self.important_words)
-        }
+        data = self._state_dict()
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -652,26 +2395,75 @@ class TurkmenBPETokenizer:
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        self._load_state_dict(data)
+        
+        print(f"✓ Tokenizer '{filepath}' faýlyndan ýüklendi")
+
+    @classmethod
+    def from_file(cls, filepath: str, cache_size: int = 10000,
+                  split_cache_size: int = 100000) -> 'TurkmenBPETokenizer':
+        """
+        save bilen saklanan faýldan täze tokenizer döredýär (konsola ýazmaýar).
+        At sanawlary faýldan alynýar; olar adaty sanawlara deň bolsa, modul
+        derejesindäki frozenset-ler we tablisalar paýlaşylýar - täze zat gurulmaýar.
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        # __init__-iň _refresh_tables-i geçilýär: tablisalar diňe ýüklenen ýagdaýdan gurulýar
+        tokenizer = cls.__new__(cls)
+        tokenizer._init_attributes(state['vocab_size'], cache_size, state.get('normalize', False),
+                                   split_cache_size)
+        tokenizer._load_state_dict(state)
+        return tokenizer
+
+    def _state_dict(self) -> Dict:
+        """
+        Tokenizeriň ýagdaýyny (save/işçi prosesler üçin) sözlük görnüşinde gaýtarýar
+        """
+        return {
+            'vocab': self.vocab,
+            'merges': self.merges,
+            'vocab_size': self.vocab_size,
+            'special_tokens': self.special_tokens,
+            'male_names': list(self.male_names),
+            'female_names': list(self.female_names),
+            'cities': list(self.cities),
+            'countries': list(self.countries),
+            'important_words': list(self.important_words),
+            'normalize': self.normalize
+        }
+
+    def _load_state_dict(self, data: Dict):
+        """
+        _state_dict() netijesinden ýagdaýy dikeldýär
+        """
         self.vocab = data['vocab']
         self.merges = [tuple(merge) for merge in data['merges']]
         self.vocab_size = data['vocab_size']
         self.special_tokens = data.get('special_tokens', self.special_tokens)
-        self.male_names = set(data.get('male_names', []))
-        self.female_names = set(data.get('female_names', []))
-        self.cities = set(data.get('cities', []))
-        self.countries = set(data.get('countries', []))
-        self.important_words = set(data.get('important_words', []))
-        
-        print(f"✓ Tokenizer '{filepath}' faýlyndan ýüklendi")
+        self.male_names = _shared_words(data.get('male_names', []), MALE_NAMES)
+        self.female_names = _shared_words(data.get('female_names', []), FEMALE_NAMES)
+        self.cities = _shared_words(data.get('cities', []), CITIES)
+        self.countries = _shared_words(data.get('countries', []), COUNTRIES)
+        self.important_words = _shared_words(data.get('important_words', []), IMPORTANT_WORDS)
+        self.normalize = data.get('normalize', False)
+        self._entity_trie = None
+        self._refresh_tables()
     
     def add_names(self, names: List[str], gender: str = 'male'):
         """
         Täze atlary goşmak (öwrenişden soň ulanmak üçin)
         """
+        words = [n.lower() for n in names]
+        # Sanawlar paýlaşylýar - ilkinji goşulanda göçürilýär, soňra ýerinde täzelenýär
         if gender == 'male':
-            self.male_names.update([n.lower() for n in names])
+            if isinstance(self.male_names, frozenset):
+                self.male_names = set(self.male_names)
+            self.male_names.update(words)
         else:
-            self.female_names.update([n.lower() for n in names])
+            if isinstance(self.female_names, frozenset):
+                self.female_names = set(self.female_names)
+            self.female_names.update(words)
         
         # Söz kitabyna goş
         for name in names:
@@ -679,28 +2471,106 @@ class TurkmenBPETokenizer:
             if name_token not in self.vocab:
                 self.vocab[name_token] = len(self.vocab)
         
+        self._add_gazetteer_words(words)
         print(f"✓ {len(names)} täze at goşuldy")
     
     def add_cities(self, cities: List[str]):
         """
         Täze şäher atlaryny goşmak
         """
-        self.cities.update([c.lower() for c in cities])
+        words = [c.lower() for c in cities]
+        if isinstance(self.cities, frozenset):
+            self.cities = set(self.cities)
+        self.cities.update(words)
         
         for city in cities:
             city_token = city.lower() + '</w>'
             if city_token not in self.vocab:
                 self.vocab[city_token] = len(self.vocab)
         
+        self._add_gazetteer_words(words)
         print(f"✓ {len(cities)} täze şäher ady goşuldy")
+
+    def _proper_type(self, word: str) -> Optional[str]:
+        """
+        Söziň at görnüşi sanawlardan (_gazetteer_table-daky ileri tutulyş bilen)
+        """
+        if word in self.male_names or word in self.female_names:
+            return 'name'
+        if word in self.cities:
+            return 'city'
+        if word in self.countries:
+            return 'country'
+        if word in self.important_words:
+            return 'important'
+        return None
+
+    def _add_gazetteer_words(self, words: List[str]):
+        """
+        Sanawlara goşulan sözler üçin tablisalary ýerinde täzeleýär - _refresh_tables ýaly
+        ähli tablisalar täzeden gurulmaýar. Keşlerden diňe täze sözlere degişli ýazgylar aýrylýar.
+        """
+        words = list(dict.fromkeys(words))
+        if self._gazetteer_shared:
+            self._gazetteer = dict(self._gazetteer)
+            self._gazetteer_shared = False
+        gazetteer = self._gazetteer
+        decode_table = self._decode_table
+        new_tokens = set()
+        for word in words:
+            gazetteer[word] = self._proper_type(word)
+            token = word + '</w>'
+            token_id = self.vocab.get(token)
+            if token_id is None:
+                continue
+            self._gazetteer_ids[word] = token_id
+            if token_id >= len(decode_table):
+                decode_table.extend([''] * (token_id + 1 - len(decode_table)))
+            if decode_table[token_id] != token:
+                decode_table[token_id] = token
+                new_tokens.add(token)
+
+        entity_starts = self._add_entities(words)
+
+        # Görnüşi üýtgän tokenler we täze köp sözli atlaryň birinji sözleri
+        for token in itertools.chain(words, entity_starts):
+            self._split_cache.pop(token, None)
+        # Täze sözleriň özi ýa-da täze tokenleri öz içine alýan söz keşi ýazgylary
+        word_set = set(words)
+        stale = [key for key, (tokens, _) in self._word_cache.items()
+                 if key[0] in word_set or not new_tokens.isdisjoint(tokens)]
+        for key in stale:
+            del self._word_cache[key]
+        self.close_pool()
+        self._tables_version += 1
+
+    def _add_entities(self, words: Iterable[str]) -> Set[str]:
+        """
+        Täze köp sözli atlary trie-e artýmly goşýar - tutuş trie täzeden gurulmaýar.
+        Görnüş täzelenen _gazetteer-den alynýar (ileri tutulyşy is_proper_noun-daky ýaly).
+        Goşulan atlaryň birinji tokenlerini gaýtarýar.
+        """
+        entries = []
+        for word in words:
+            tokens = _entity_tokens(word)
+            if tokens is not None:
+                entries.append((tokens, (word, self._gazetteer[word])))
+        if entries:
+            self._entity_trie = _trie_insert(self._entity_trie, entries, self._entity_owned)
+            self._entity_depth = max(self._entity_depth, max(len(tokens) for tokens, _ in entries))
+        return {tokens[0] for tokens, _ in entries}
     
     def export_to_huggingface(self, save_path: str = "turkmen_hf_tokenizer.json"):
         """
         Hugging Face 'tokenizers' formatyna geçirýär we saklaýar.
         Uly modeller (BERT, GPT) bilen ulanmak üçin.
+
+        Doly pipeline göçürilýär: kiçi harplar (we normalize=True bolsa normalize_text),
+        adaty atlar tutuş söz tokeni hökmünde, TOKEN_PATTERN regex, goşulma bölmek,
+        "</w>" goşulmaly BPE we dekoder. Netijäni check_huggingface_parity bilen barlaň.
         """
         try:
-            from tokenizers import Tokenizer, models, pre_tokenizers, decoders
+            from tokenizers import Tokenizer, AddedToken, Regex, models, normalizers, pre_tokenizers, decoders
         except ImportError:
             print("❌ Bu funksiýa üçin 'tokenizers' kitaphanasy gerek.")
             print("Haýyş, 'pip install tokenizers' buýrugyny ýerine ýetiriň.")
@@ -708,29 +2578,437 @@ class TurkmenBPETokenizer:
 
         print("🔄 Hugging Face formatyna geçirilýär...")
         
-        # Vocab (sozluk) dict formatyndan list formatyna geçirmek zerur bolup biler, 
-        # ýöne HF BPE modeli göni dict kabul edýär (token -> id).
-        # Biziň 'merges' listimiz tuple (a, b), ýöne HF string "a b" isleýär.
-        
-        hf_merges = [f"{p[0]} {p[1]}" for p in self.merges]
-        
-        # Täze tokenizer döretmek
-        # Unknown token hökmünde <unk> ulanýarys
-        hf_tokenizer = Tokenizer(models.BPE(vocab=self.vocab, merges=hf_merges, unk_token="<unk>"))
+        # HF BPE birleşdirmelerdäki ähli tokenleriň söz kitabynda bolmagyny talap edýär.
+        # Köne modellerde ýok bolan söz soňy tokenleri täze ID-ler bilen goşulýar -
+        # Python olary <unk> edýär, şonuň üçin ol sözlerde ID-ler tapawutlanar.
+        vocab = dict(self.vocab)
+        next_id = max(vocab.values(), default=-1) + 1
+        missing = []
+        for first, second in self.merges:
+            for token in (first, second, first + second):
+                if token not in vocab:
+                    vocab[token] = next_id
+                    next_id += 1
+                    missing.append(token)
+        if missing:
+            print(f"⚠ Söz kitabynda ýok {len(missing)} token goşuldy (mysal: {missing[:5]}). "
+                  f"Doly gabat gelmek üçin modeli täzeden öwrediň.")
+
+        # HF BPE birleşdirmeleri (a, b) tuple sanawy görnüşinde kabul edýär
+        hf_merges = [tuple(merge) for merge in self.merges]
         
-        # Tokenizer sazlamalary (Pre-tokenizer)
-        # Biziň Python kodumyzda edýän whitespace bölmegimizi gaýtalamaly
-        hf_tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+        # Unknown token hökmünde <unk> ulanýarys, söz soňy "</w>" (split_word_to_chars ýaly)
+        hf_tokenizer = Tokenizer(models.BPE(vocab=vocab, merges=hf_merges, unk_token="<unk>",
+                                            end_of_word_suffix="</w>"))
+
+        # Normalizer: (normalize_text) + kiçi harplar + adaty atlaryň yzyna "</w>" goşmak.
+        # Soňra "at</w>" goşulan token hökmünde tutuş alynýar (_gazetteer_ids ýaly).
+        steps = []
+        if self.normalize:
+            steps.append(normalizers.NFKC())
+            # "...</w>" goşulan tokenleriň özi hem normalizerden geçýär - olara degmeli däl
+            for char, replacement in NORMALIZE_TABLE.items():
+                steps.append(normalizers.Replace(Regex(f"{re.escape(chr(char))}(?![{WORD_CHARS}]*</w>)"),
+                                                 replacement or ""))
+        steps.append(normalizers.Lowercase())
+
+        whole_words = sorted(word for word in self._gazetteer_ids
+                             if re.fullmatch(f"[{WORD_CHARS}]+", word))
+        if whole_words:
+            # Sözüň öňünde we yzynda harp bolmaly däl - regex tokeniniň tutuşlygyna gabat gelýär.
+            # \\K gabat gelmäni sözüň soňuna geçirýär: "</w>" şol ýere goýulýar
+            steps.append(normalizers.Replace(
+                Regex(f"(?<![{WORD_CHARS}])(?:{'|'.join(whole_words)})\\K(?![{WORD_CHARS}]|</w>)"), "</w>"))
+            hf_tokenizer.add_tokens([AddedToken(word + "</w>", normalized=True) for word in whole_words])
+        hf_tokenizer.normalizer = normalizers.Sequence(steps)
+        # Köp sözli atlar (trie) HF pipeline-da ýok: olar aýry sözler hökmünde bölünýär
+        entities = sorted(word for word in self._gazetteer_ids if ' ' in word)
+        if entities:
+            print(f"⚠ {len(entities)} köp sözli at (mysal: {entities[:3]}) HF-de bir token bolmaýar - "
+                  f"şeýle atly tekstlerde ID-ler tapawutlanar.")
+
+        # Pre-tokenizer: TOKEN_PATTERN gabat gelýän bölekleri saklanýar, galany aýrylýar.
+        # Oniguruma-nyň \\w/\\s toplumlary Python-dan tapawutlanýar, şonuň üçin açyk ýazylýar:
+        # Python \\w = harp, san ýa-da "_"; \\s hem \\x1c-\\x1f öz içine alýar
+        pattern = TOKEN_PATTERN.replace(r"[^\w\s]", r"[^\p{L}\p{N}_\s\x1c-\x1f]")
+        splits = [pre_tokenizers.Split(Regex(pattern), behavior="removed", invert=True)]
+
+        # Goşulma bölmek (aggressive_suffix_split): iň gysga kök (>= 2 harp) = iň uzyn goşulma,
+        # bir harply goşulma üçin kök >= 3 (söz >= 4). Adaty atlara degilmeýär.
+        long_suffixes = sorted(re.escape(sfx) for sfx in self._suffix_set if len(sfx) > 1)
+        short_suffixes = sorted(re.escape(sfx) for sfx in self._suffix_set if len(sfx) == 1)
+        alternatives = []
+        if long_suffixes:
+            alternatives.append(f".{{2,}}?\\K(?:{'|'.join(long_suffixes)})")
+        if short_suffixes:
+            alternatives.append(f".{{3,}}?\\K(?:{'|'.join(short_suffixes)})")
+        if alternatives:
+            proper = sorted(re.escape(word) for word in self._gazetteer if word not in self._gazetteer_ids)
+            guard = f"(?!(?:{'|'.join(proper)})$)" if proper else ""
+            splits.append(pre_tokenizers.Split(Regex(f"^{guard}(?:{'|'.join(alternatives)})$"),
+                                               behavior="isolated"))
+        hf_tokenizer.pre_tokenizer = pre_tokenizers.Sequence(splits)
+
+        hf_tokenizer.decoder = decoders.BPEDecoder(suffix="</w>")
+        hf_tokenizer.add_special_tokens([AddedToken(token, special=True)
+                                         for token, _ in sorted(self.special_tokens.items(), key=lambda item: item[1])])
         
         # Saklamak
         hf_tokenizer.save(save_path)
         print(f"✅ Hugging Face tokenizer '{save_path}' faýlyna saklandy!")
+        return hf_tokenizer
+
+    def check_huggingface_parity(self, corpus_path: str, hf_tokenizer=None,
+                                 max_examples: int = 10) -> Dict:
+        """
+        Python encode/decode bilen HF tokenizeriniň netijelerini korpusyň her setirinde deňeşdirýär.
+        hf_tokenizer - faýl ýoly ýa-da tokenizers.Tokenizer (berilmese export_to_huggingface).
+        Gaýtaryş: {'lines', 'mismatched_lines', 'examples': [{'line', 'text', 'python', 'huggingface', ...}]}
+        """
+        from tokenizers import Tokenizer
+
+        if hf_tokenizer is None:
+            with tempfile.TemporaryDirectory() as tmp:
+                hf_tokenizer = self.export_to_huggingface(os.path.join(tmp, "tokenizer.json"))
+        elif isinstance(hf_tokenizer, str):
+            hf_tokenizer = Tokenizer.from_file(hf_tokenizer)
+
+        with open(corpus_path, "r", encoding="utf-8") as f:
+            lines = [line.rstrip("\n") for line in f]
+
+        encodings = hf_tokenizer.encode_batch(lines, add_special_tokens=False)
+        mismatched = 0
+        examples = []
+        for line_no, (text, encoding) in enumerate(zip(lines, encodings), 1):
+            ids = self.encode(text)
+            if ids == encoding.ids and self.decode(ids) == hf_tokenizer.decode(encoding.ids):
+                continue
+            mismatched += 1
+            if len(examples) < max_examples:
+                examples.append({'line': line_no, 'text': text,
+                                 'python': self.tokenize(text), 'huggingface': encoding.tokens,
+                                 'python_ids': ids, 'huggingface_ids': encoding.ids})
+
+        if mismatched:
+            print(f"❌ {mismatched}/{len(lines)} setir gabat gelmeýär")
+            for example in examples:
+                print(f"  {example['line']}: {example['text']!r}")
+                print(f"    python:      {example['python']} {example['python_ids']}")
+                print(f"    huggingface: {example['huggingface']} {example['huggingface_ids']}")
+        else:
+            print(f"✅ Ähli {len(lines)} setir gabat gelýär")
+        return {'lines': len(lines), 'mismatched_lines': mismatched, 'examples': examples}
+
+
+class DecodeStream:
+    """
+    Artýmly dekoder: ID-leri birme-bir kabul edýär we taýýar teksti gaýtarýar.
+    step() netijeleriniň we finish()-iň jemi decode(ähli_id) bilen deň bolýar,
+    öňki bölek gaýtadan dekodlanmaýar.
+
+    Meselem:
+        stream = tokenizer.decode_stream()
+        for token_id in generated_ids:
+            print(stream.step(token_id), end='')
+        print(stream.finish())
+    """
+
+    _MARKER = '</w>'
+
+    def __init__(self, tokenizer: TurkmenBPETokenizer):
+        self._table = tokenizer._decode_table
+        self._raw = ''        # Entek işlenmedik bölek ('</w>'-iň başlangyjy bolup biler)
+        self._space = ''      # Saklanýan soňky boşluklar (strip() ýaly)
+        self._started = False
+
+    def step(self, token_id: int) -> str:
+        """
+        Bir ID goşýar we täze taýýar bolan teksti gaýtarýar
+        """
+        if 0 <= token_id < len(self._table):
+            self._raw += self._table[token_id]
+        raw = self._raw
+        # '</w>'-iň doly däl başlangyjyny indiki ID üçin saklaýarys
+        hold = 0
+        for k in range(len(self._MARKER) - 1, 0, -1):
+            if raw.endswith(self._MARKER[:k]):
+                hold = k
+                break
+        ready = raw[:len(raw) - hold]
+        self._raw = raw[len(raw) - hold:]
+        return self._emit(ready.replace(self._MARKER, ' '))
+
+    def finish(self) -> str:
+        """
+        Galan teksti gaýtarýar we dekoderi täzeden başlaýar
+        """
+        text = self._emit(self._raw)
+        self._raw = ''
+        self._space = ''
+        self._started = False
+        return text
+
+    def _emit(self, text: str) -> str:
+        text = self._space + text
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return ''
+            self._started = True
+        body = text.rstrip()
+        self._space = text[len(body):]
+        return body
+
+
+class DocumentSession:
+    """
+    Redaktirlenýän resminama üçin artýmly encode: tekst, onuň birlikleri
+    (regex sözi ýa-da köp sözli at) we token ID-leri saklanýar. apply_edit diňe
+    üýtgän sözleri täzeden tokenleýär we ID sanawyna goýýar - netije hemişe
+    encode(text) bilen deň.
+
+    Meselem:
+        session = tokenizer.document_session("Ahmet mekdepde")
+        session.apply_edit(6, 14, "öýde")
+        assert session.ids == tokenizer.encode(session.text)
+
+    Birlikleriň orunlary gap buffer ýaly saklanýar: pivot-dan soňky birlikler üçin
+    hakyky orun = saklanan + süýşme. Şonuň üçin tokenlemek işi resminamanyň uzynlygyna
+    däl-de, redaktirlemäniň ölçegine we öňki redaktirlemeden uzaklygyna bagly. Diňe
+    teksti (str) we ID sanawyny täzelemek C derejesindäki göçürme bolup galýar.
+    normalize=True bolsa (normalize_text ýerli däl) her gezek doly encode edilýär.
+    """
+
+    def __init__(self, tokenizer: TurkmenBPETokenizer, text: str = ''):
+        self.tokenizer = tokenizer
+        self.set_text(text)
+
+    def set_text(self, text: str):
+        """
+        Resminamany doly täzeden tokenleýär
+        """
+        tokenizer = self.tokenizer
+        self.text = text
+        # Tokenizer üýtgese (add_names, load...) tablisalaryň wersiýasy artýar
+        self._tables_version = tokenizer._tables_version
+        self._starts, self._ends, self._id_starts = [], [], []
+        self._pivot = 0
+        self._char_shift = 0
+        self._id_shift = 0
+        if tokenizer.normalize:
+            self.ids = tokenizer.encode(text)
+            return
+
+        tokens = self._lex(0, len(text))
+        units, _ = self._units(tokens, {len(tokens): 0}, len(tokens))
+        self.ids = []
+        for start, end, ids in units:
+            self._starts.append(start)
+            self._ends.append(end)
+            self._id_starts.append(len(self.ids))
+            self.ids.extend(ids)
+
+    def apply_edit(self, start: int, end: int, new_text: str) -> Tuple[int, int, List[int]]:
+        """
+        text[start:end] ýerine new_text goýýar we diňe degişli sözleri täzeden tokenleýär.
+        Gaýtaryş: (başy, aýrylan ID sany, täze ID-ler) - ids-iň şol bölegi çalşyryldy
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Nädogry aralyk [{start}, {end}): tekstiň uzynlygy {len(self.text)}")
+        tokenizer = self.tokenizer
+        text = self.text[:start] + new_text + self.text[end:]
+        if tokenizer.normalize or self._tables_version != tokenizer._tables_version:
+            removed = len(self.ids)
+            self.set_text(text)
+            return 0, removed, list(self.ids)
+        delta = len(new_text) - (end - start)
+
+        # Redaktirlemä degýän (ýanaşýan hem) birlikler: [first, last)
+        count = len(self._starts)
+        first = self._bisect(self._ends, start, right=False)
+        last = self._bisect(self._starts, end, right=True)
+        # Köp sözli at öňki sözlerden başlap bilýär: iň uzyn atyň token sany çenli yza
+        depth = tokenizer._entity_depth
+        begin = max(0, first - (depth - 1))
+        self._move_pivot(begin)
+        shift = self._char_shift
+        lo, hi = start, end
+        if begin < last:
+            lo = min(lo, self._starts[begin] + shift)
+        if first < last:
+            hi = max(hi, self._ends[last - 1] + shift)
+        self.text = text
+
+        # Täze tokenler; yzyndaky köne birlikler gerek boldugyça goşulýar. Köne birligiň
+        # başynda täze birlik başlasa, mundan soňky ähli birlikler üýtgemeýär
+        tokens = self._lex(lo, hi + delta)
+        boundaries = {}
+        tail, extra = last, depth
+        while True:
+            while tail < count and tail - last < extra:
+                boundaries[len(tokens)] = tail
+                tokens.extend(self._lex(self._starts[tail] + shift + delta, self._ends[tail] + shift + delta))
+                tail += 1
+            boundaries[len(tokens)] = tail
+            limit = len(tokens) if tail == count else len(tokens) - depth + 1
+            units, stop = self._units(tokens, boundaries, limit)
+            if stop is not None:
+                break
+            extra *= 2
+
+        id_lo = self._id_starts[begin] + self._id_shift if begin < count else len(self.ids)
+        id_hi = self._id_starts[stop] + self._id_shift if stop < count else len(self.ids)
+        new_ids = []
+        starts, ends, id_starts = [], [], []
+        for unit_start, unit_end, ids in units:
+            starts.append(unit_start)
+            ends.append(unit_end)
+            id_starts.append(id_lo + len(new_ids))
+            new_ids.extend(ids)
+        self.ids[id_lo:id_hi] = new_ids
+        self._starts[begin:stop] = starts
+        self._ends[begin:stop] = ends
+        self._id_starts[begin:stop] = id_starts
+        # Täze birlikler hakyky orunlarda, yzyndakylar üçin süýşme ulalýar
+        self._pivot = begin + len(units)
+        self._char_shift += delta
+        self._id_shift += len(new_ids) - (id_hi - id_lo)
+        return id_lo, id_hi - id_lo, new_ids
+
+    def _bisect(self, values: List[int], position: int, right: bool) -> int:
+        """
+        Gijikdirilen süýşmäni hasaba alyp bisect (pivot-dan öň we soň aýratyn tertipli)
+        """
+        search = bisect.bisect_right if right else bisect.bisect_left
+        pivot, shift = self._pivot, self._char_shift
+        if pivot < len(values):
+            first = values[pivot] + shift
+            if first <= position if right else first < position:
+                return search(values, position - shift, pivot)
+        return search(values, position, 0, pivot)
+
+    def _move_pivot(self, index: int):
+        """
+        Pivot-y index-e geçirýär: aradaky birlikleriň orunlary düzedilýär
+        """
+        pivot = self._pivot
+        char_shift, id_shift = self._char_shift, self._id_shift
+        if char_shift or id_shift:
+            sign = 1 if index > pivot else -1
+            for i in range(min(pivot, index), max(pivot, index)):
+                self._starts[i] += sign * char_shift
+                self._ends[i] += sign * char_shift
+                self._id_starts[i] += sign * id_shift
+        self._pivot = index
+
+    def _lex(self, lo: int, hi: int) -> List[Tuple[str, int, int]]:
+        """
+        text[lo:hi] böleginiň regex tokenleri asyl tekstdäki orunlary bilen
+        (encode_with_offsets ýaly kiçi harpa geçende uzalýan harplar hasaba alynýar)
+        """
+        segment = self.text[lo:hi]
+        lowered = segment.lower()
+        index_map = None
+        if len(lowered) != len(segment):
+            index_map = []
+            for i, char in enumerate(segment):
+                index_map.extend([i] * len(char.lower()))
+        tokens = []
+        for match in TOKEN_RE.finditer(lowered):
+            start, end = match.span()
+            if index_map is not None:
+                start, end = index_map[start], index_map[end - 1] + 1
+            tokens.append((match.group(), lo + start, lo + end))
+        return tokens
+
+    def _units(self, tokens: List[Tuple[str, int, int]], boundaries: Dict[int, int],
+               limit: int) -> Tuple[List[Tuple[int, int, List[int]]], Optional[int]]:
+        """
+        Tokenleri birliklere toparlaýar we kodlaýar (pre_tokenize + _encode_word ýaly).
+        boundaries-daky token indeksinde (köne birligiň başy) birlik başlasa durulýar.
+        limit-den soň köp sözli at gözlemek üçin tokenler ýetmezçilik edýär.
+        Gaýtaryş: (birlikler, duran köne birligiň indeksi ýa-da None - has köp token gerek)
+        """
+        tokenizer = self.tokenizer
+        entities = tokenizer._find_entities([token for token, _, _ in tokens])
+        units = []
+        index = 0
+        while True:
+            stop = boundaries.get(index)
+            if stop is not None:
+                return units, stop
+            if index >= limit:
+                return units, None
+            match = entities.get(index)
+            if match is not None:
+                end, (word, word_type) = match
+                ids = list(tokenizer._encode_word(word, word_type)[1])
+            else:
+                end = index + 1
+                ids = []
+                for piece, piece_type in tokenizer._split_token(tokens[index][0]):
+                    ids.extend(tokenizer._encode_word(piece, piece_type)[1])
+            unit_start, unit_end = tokens[index][1], tokens[end - 1][2]
+            if units and units[-1][1] > unit_start:
+                # Kiçi harpa geçende uzalan harp iki tokene bölündi ('İ' -> 'i' + '̇'):
+                # asyl tekstde aýry orny ýok, şonuň üçin bir birlik
+                previous_start, previous_end, previous_ids = units.pop()
+                unit_start, unit_end = previous_start, max(previous_end, unit_end)
+                ids = previous_ids + ids
+            units.append((unit_start, unit_end, ids))
+            index = end
+
+
+def load_token_shard(path: str) -> Dict:
+    """
+    encode_file bilen ýazylan faýllary np.memmap arkaly (ýada göçürmezden) açýar:
+    {'ids': (tokenler,), 'offsets': (setirler + 1,), 'meta': {...}}
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("load_token_shard üçin 'numpy' kitaphanasy gerek ('pip install numpy').")
+
+    with open(path + '.json', 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('format') != SHARD_FORMAT:
+        raise ValueError(f"'{path}' encode_file faýly däl")
+    dtype = np.dtype(meta['dtype']).newbyteorder('<')
+    # Ýarym ýazylan faýlda meta-da görkezilen doly setirler ulanylýar
+    ids = (np.memmap(path, dtype=dtype, mode='r', shape=(meta['tokens'],))
+           if meta['tokens'] else np.zeros(0, dtype=dtype))
+    offsets = np.memmap(path + '.idx', dtype='<u8', mode='r', shape=(meta['lines'] + 1,))
+    return {'ids': ids, 'offsets': offsets, 'meta': meta}
+
+
+# Işçi prosesdäki tokenizer (encode_batch/decode_batch üçin)
+_WORKER_TOKENIZER = None
+
+
+def _init_worker(state: Dict, split_cache: Optional[Dict] = None):
+    """
+    Işçi prosesi başlanda tokenizer ýagdaýyny bir gezek ýükleýär.
+    split_cache - esasy prosesiň gyzan pre_tokenize keşi (fork-da göçürilmeýär)
+    """
+    global _WORKER_TOKENIZER
+    tokenizer = TurkmenBPETokenizer()
+    tokenizer._load_state_dict(state)
+    if split_cache:
+        tokenizer._split_cache = split_cache
+    _WORKER_TOKENIZER = tokenizer
+
+
+def _worker_call(task):
+    func, chunk = task
+    return func(_WORKER_TOKENIZER, chunk)
 
 
 # Ulanyş mysaly
 if __name__ == "__main__":
 
-    turkmen_corpus = open("dataset_AB_220524.txt", "r", encoding="utf-8").readlines()
+    # train faýl ýoluny kabul edýär (setirleriň sanawyny däl)
+    turkmen_corpus = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "all-raw-datas", "tmpoem2000.txt")
     print("=" * 60)
     tokenizer = TurkmenBPETokenizer(vocab_size=1000)
     tokenizer.train(turkmen_corpus, verbose=True)
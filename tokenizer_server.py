@@ -0,0 +1,348 @@
+"""
+Türkmen BPE Tokenizer üçin asyncio HTTP/JSON hyzmaty (diňe standart kitaphana).
+
+Birwagtda gelen soraglar mikro-toplumlara (micro-batch) ýygnalýar: toplum
+max_batch_size tekste ýetende ýa-da max_wait_ms geçende işçi proseslere iberilýär.
+Her işçi prosesde tokenizer `save` bilen saklanan faýldan diňe bir gezek ýüklenýär.
+
+Ulanyş:
+    python tokenizer_server.py --model turkmen_tokenizer.json --port 8080 --workers 4
+
+Endpointler:
+    POST /encode   {"text": "..."} -> {"ids": [...]}
+                   {"texts": ["...", ...]} -> {"ids": [[...], ...]}
+    POST /decode   {"ids": [...]} -> {"text": "..."}
+    GET  /metrics  gecikme (p50/p99), nobat çuňlugy, toplum statistikasy
+    GET  /health   {"status": "ok"}
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from bpetokenizer import TurkmenBPETokenizer
+
+# Soragyň göwresiniň deslapky çägi (baýt)
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Işçi prosesdäki tokenizer
+_SERVER_TOKENIZER = None
+
+
+def _init_server_worker(model_path: str):
+    """
+    Işçi prosesi başlanda tokenizeri faýldan bir gezek ýükleýär
+    """
+    global _SERVER_TOKENIZER
+    _SERVER_TOKENIZER = TurkmenBPETokenizer.from_file(model_path)
+
+
+def _call_each(func, items: List) -> Tuple[List, Dict[int, str]]:
+    """
+    func-y her element üçin aýratyn çagyrýar: bir elementiň ýalňyşlygy diňe
+    şol elementiň soragyna degişli bolar ýaly, ýalňyşlyklar indeks boýunça gaýtarylýar
+    """
+    results, errors = [], {}
+    for index, item in enumerate(items):
+        try:
+            results.append(func(item))
+        except Exception as error:
+            results.append(None)
+            errors[index] = f"{type(error).__name__}: {error}"
+    return results, errors
+
+
+def _encode_texts(texts: List[str]) -> Tuple[List[List[int]], Dict[int, str]]:
+    return _call_each(_SERVER_TOKENIZER.encode, texts)
+
+
+def _decode_ids(list_of_ids: List[List[int]]) -> Tuple[List[str], Dict[int, str]]:
+    return _call_each(_SERVER_TOKENIZER.decode, list_of_ids)
+
+
+class ItemError(ValueError):
+    """
+    Toplumdaky bir soragyň öz elementleri işlenende ýüze çykan ýalňyşlyk
+    """
+
+
+class LatencyStats:
+    """
+    Soňky N soragyň gecikmesini saklaýar we prosentilleri hasaplaýar
+    """
+
+    def __init__(self, window: int = 10000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(q / 100.0 * len(ordered)))
+        return ordered[index]
+
+
+class MicroBatcher:
+    """
+    Soraglary nobata ýygnaýar we toplum bilen işçi proseslere iberýär.
+    func (results, errors) gaýtarýar: errors - element indeksi -> ýalňyşlyk teksti,
+    şeýle elementli sorag ItemError alýar, toplumdaky beýleki soraglar adaty netije alýar.
+    """
+
+    def __init__(self, executor: ProcessPoolExecutor, func, max_batch_size: int = 64,
+                 max_wait_ms: float = 2.0, max_in_flight: int = 4):
+        self.executor = executor
+        self.func = func
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue = asyncio.Queue()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._tasks = set()
+        self.batches = 0
+        self.batched_items = 0
+
+    async def submit(self, items: List) -> List:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((items, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+
+            while size < self.max_batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                batch.append(item)
+                size += len(item[0])
+
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[Tuple[List, asyncio.Future]]):
+        try:
+            items = [item for chunk, _ in batch for item in chunk]
+            self.batches += 1
+            self.batched_items += len(items)
+            results, errors = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.func, items)
+            position = 0
+            for chunk, future in batch:
+                if not future.done():
+                    failed = [errors[index] for index in range(position, position + len(chunk))
+                              if index in errors]
+                    if failed:
+                        future.set_exception(ItemError(failed[0]))
+                    else:
+                        future.set_result(results[position:position + len(chunk)])
+                position += len(chunk)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+        finally:
+            self._in_flight.release()
+
+
+class TokenizerServer:
+    """
+    HTTP/1.1 (keep-alive) JSON hyzmaty
+    """
+
+    REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large',
+               500: 'Internal Server Error'}
+
+    def __init__(self, model_path: str, num_workers: Optional[int] = None,
+                 max_batch_size: int = 64, max_wait_ms: float = 2.0,
+                 max_body_bytes: int = DEFAULT_MAX_BODY_BYTES):
+        self.model_path = model_path
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_body_bytes = max_body_bytes
+        self.latency = LatencyStats()
+        self.started = time.time()
+        self.executor = None
+        self.encoder = None
+        self.decoder = None
+
+    def metrics(self) -> Dict:
+        def ms(value):
+            return None if value is None else round(value * 1000.0, 3)
+
+        batches = self.encoder.batches + self.decoder.batches
+        items = self.encoder.batched_items + self.decoder.batched_items
+        return {
+            'requests': self.latency.count,
+            'latency_ms': {'p50': ms(self.latency.percentile(50)),
+                           'p99': ms(self.latency.percentile(99))},
+            'queue_depth': self.encoder.queue.qsize() + self.decoder.queue.qsize(),
+            'batches': batches,
+            'avg_batch_size': round(items / batches, 2) if batches else 0.0,
+            'workers': self.num_workers,
+            'uptime_sec': round(time.time() - self.started, 1),
+        }
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if method == 'GET' and path == '/health':
+            return 200, {'status': 'ok'}
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method != 'POST' or path not in ('/encode', '/decode'):
+            return 404, {'error': 'not found'}
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            return 400, {'error': 'invalid JSON'}
+        if not isinstance(payload, dict):
+            return 400, {'error': 'JSON obýekt gerek'}
+
+        # Elementleriň görnüşi toplum umumy bolmanka barlanýar: nädogry sorag
+        # başga müşderileriň soraglary bilen bir toplumda işçä ýetmeli däl
+        try:
+            if path == '/encode':
+                texts = payload.get('texts')
+                if isinstance(texts, list):
+                    if not all(isinstance(text, str) for text in texts):
+                        return 400, {'error': "'texts' diňe setirlerden durmaly"}
+                    return 200, {'ids': await self.encoder.submit(texts)}
+                if isinstance(payload.get('text'), str):
+                    return 200, {'ids': (await self.encoder.submit([payload['text']]))[0]}
+                return 400, {'error': "'text' ýa-da 'texts' gerek"}
+
+            ids = payload.get('ids')
+            if isinstance(ids, list):
+                if not all(isinstance(token_id, int) and not isinstance(token_id, bool) for token_id in ids):
+                    return 400, {'error': "'ids' diňe bitin sanlardan durmaly"}
+                return 200, {'text': (await self.decoder.submit([ids]))[0]}
+            return 400, {'error': "'ids' gerek"}
+        except ItemError as error:
+            return 400, {'error': str(error)}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                started = time.perf_counter()
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    break
+                method, path, _ = parts
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                # Göwre okalmazdan öň barlanýar: çäksiz Content-Length ýady doldurmaly däl.
+                # Göwre okalmadyk bolsa, birikme jogapdan soň ýapylýar
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                rejected = True
+                if length < 0:
+                    status, payload = 400, {'error': "Content-Length nädogry"}
+                elif length > self.max_body_bytes:
+                    status, payload = 413, {'error': f"göwre {self.max_body_bytes} baýtdan uly"}
+                else:
+                    rejected = False
+                    body = await reader.readexactly(length) if length else b''
+                    try:
+                        status, payload = await self._route(method, path, body)
+                    except Exception as error:
+                        status, payload = 500, {'error': str(error)}
+
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write((f"HTTP/1.1 {status} {self.REASONS[status]}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(data)}\r\n\r\n").encode('latin-1') + data)
+                await writer.drain()
+                if path in ('/encode', '/decode'):
+                    self.latency.add(time.perf_counter() - started)
+
+                if rejected or headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8080):
+        self.executor = ProcessPoolExecutor(self.num_workers, initializer=_init_server_worker,
+                                            initargs=(self.model_path,))
+        self.encoder = MicroBatcher(self.executor, _encode_texts, self.max_batch_size,
+                                    self.max_wait_ms, max_in_flight=self.num_workers)
+        self.decoder = MicroBatcher(self.executor, _decode_ids, self.max_batch_size,
+                                    self.max_wait_ms, max_in_flight=self.num_workers)
+        batchers = [asyncio.create_task(self.encoder.run()), asyncio.create_task(self.decoder.run())]
+
+        # Işçiler birikmeler kabul edilmezden öň başladylýar: fork bilen döredilen işçi
+        # açyk müşderi sokedini miras alsa, 'Connection: close' müşderisi EOF almaýar.
+        # Model hem ilkinji soragdan öň ýüklenýär
+        await asyncio.get_running_loop().run_in_executor(self.executor, _encode_texts, [])
+
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        print(f"✓ Tokenizer hyzmaty http://{host}:{port} salgysynda işleýär "
+              f"({self.num_workers} işçi, toplum ≤ {self.max_batch_size}, {self.max_wait_ms} ms)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in batchers:
+                task.cancel()
+            self.executor.shutdown(cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Türkmen BPE Tokenizer HTTP hyzmaty")
+    parser.add_argument("--model", required=True, help="save() bilen saklanan tokenizer faýly")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--max-body-bytes", type=int, default=DEFAULT_MAX_BODY_BYTES,
+                        help="soragyň göwresiniň iň uly ölçegi (baýt); uly soraglara 413 gaýtarylýar")
+    args = parser.parse_args()
+
+    server = TokenizerServer(args.model, num_workers=args.workers,
+                             max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms,
+                             max_body_bytes=args.max_body_bytes)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()